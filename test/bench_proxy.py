@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+micro benchmark for proxy per-call overhead.
+
+a stub ``hou`` module is installed before yurlungur is imported,
+so the numbers measure only the yurlungur side of each call.
+
+    $ python test/bench_proxy.py
+    $ python test/bench_proxy.py --baseline 56f088e
+"""
+import os
+import sys
+import json
+import types
+import shutil
+import timeit
+import argparse
+import tempfile
+import subprocess
+import contextlib
+
+
+class _Template(object):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def namingScheme(self):
+        return types.SimpleNamespace(name=lambda: "XYZW")
+
+    def type(self):
+        return "Float"
+
+    def defaultValue(self):
+        return (0.0, 0.0, 0.0)
+
+    def numComponents(self):
+        return 3
+
+
+class _Tuple(object):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class _Parm(object):
+    def __init__(self, name):
+        self._name = name
+        self._value = 0.0
+
+    def name(self):
+        return self._name
+
+    def parmTemplate(self):
+        return _Template(self._name[:-1])
+
+    def componentIndex(self):
+        return "xyz".index(self._name[-1])
+
+    def tuple(self):
+        return _Tuple(self._name[:-1])
+
+    def eval(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class _Node(object):
+    def __init__(self, path):
+        self._path = path
+        self._parms = dict((p, _Parm(p)) for p in ("tx", "ty", "tz", "rx", "ry", "rz"))
+
+    def path(self):
+        return self._path
+
+    def name(self):
+        return self._path.rsplit("/", 1)[-1]
+
+    def sessionId(self):
+        return id(self)
+
+    def type(self):
+        group = types.SimpleNamespace(entriesWithoutFolders=lambda: [_Template("t"), _Template("r")])
+        return types.SimpleNamespace(nameWithCategory=lambda: "Object/geo", parmTemplateGroup=lambda: group)
+
+    def parm(self, name):
+        return self._parms.get(name)
+
+    def parmTuple(self, name):
+        return None
+
+    def parms(self):
+        return list(self._parms.values())
+
+
+def stub_hou():
+    """minimal hou module for benchmarking"""
+    hou = types.ModuleType("hou")
+    nodes = {}
+    hou.hda = types.ModuleType("hou.hda")
+    hou.node = lambda path: nodes.setdefault(path, _Node(path))
+    hou.hipFile = types.SimpleNamespace(path=lambda: "/tmp/untitled.hip")
+    hou.undos = types.SimpleNamespace(group=lambda label: contextlib.nullcontext())
+    hou.hscript = lambda script: ("", "")
+    hou.parmTemplateType = types.SimpleNamespace(
+        Int="Int", Float="Float", String="String", Toggle="Toggle", Menu="Menu")
+    return hou
+
+
+def measure(number=2000):
+    """us per call of every test, None when the tree has no such api"""
+    sys.modules["hou"] = hou = stub_hou()
+    import yurlungur
+    from yurlungur.core.proxy import Node, File
+
+    # nodes from native handles, which the baseline tree takes as well
+    node = Node(hou.node("/obj/geo1"))
+    nodes = [Node(hou.node("/obj/geo%d" % i)) for i in range(100)]
+    array = getattr(yurlungur, "NodeArray", tuple)(nodes)
+    tests = [
+        ("hou.node().parm().eval()", lambda: hou.node("/obj/geo1").parm("tx").eval()),
+        ("Node.attr(name)", lambda: node.attr("tx")),
+        ("Node.attr(name).set(v)", lambda: node.attr("tx").set(1.0)),
+        ("Node.name", lambda: node.name),
+        ("Node.tx.set(v)", lambda: node.tx.set(1.0)),
+        ("File.current", lambda: File("x.hip").current),
+        ("6 x Node.attr(name).value", lambda: [node.attr(p).value for p in ("tx", "ty", "tz", "rx", "ry", "rz")]),
+        ("Node.snapshot_attrs()", lambda: node.snapshot_attrs()),
+        ("100 x Node.attr(name).value", lambda: [n.attr("tx").value for n in nodes]),
+        ("NodeArray.attr(name).values", lambda: array.attr("tx").values),
+    ]
+    results = []
+    for label, fn in tests:
+        try:
+            fn()
+        except Exception:
+            results.append((label, None))
+            continue
+        sec = min(timeit.repeat(fn, number=number, repeat=5))
+        results.append((label, sec / number * 1e6))
+    return results
+
+
+def baseline(rev, number):
+    """measure the yurlungur package of git revision rev in a child process"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    tmp = tempfile.mkdtemp()
+    try:
+        archive = subprocess.Popen(["git", "archive", rev, "yurlungur"], cwd=root, stdout=subprocess.PIPE)
+        subprocess.check_call(["tar", "-x", "-C", tmp], stdin=archive.stdout)
+        if archive.wait():
+            raise RuntimeError("git archive %s failed" % rev)
+        out = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), "--root", tmp, "--json", "-n", str(number)],
+            stderr=subprocess.DEVNULL
+        )
+    finally:
+        shutil.rmtree(tmp)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", metavar="REV", help="git revision measured as before")
+    parser.add_argument("--root", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.root or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    before = dict(baseline(args.baseline, args.number)) if args.baseline else None
+    results = measure(args.number)
+    if args.json:
+        print(json.dumps(results))
+        return
+
+    def cell(us):
+        return "{0:10.2f}".format(us) if us is not None else "{0:>10}".format("-")
+
+    if before is None:
+        for label, us in results:
+            print("{0:<28}{1} us/call".format(label, cell(us)))
+        return
+    print("{0:<28}{1:>10}{2:>10}".format("us/call", "before", "after"))
+    for label, us in results:
+        print("{0:<28}{1}{2}".format(label, cell(before.get(label)), cell(us)))
+
+
+if __name__ == '__main__':
+    main()
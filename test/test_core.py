@@ -17,5 +17,471 @@ class TestCore(unittest.TestSuite):
         print(yurlungur.blender.shell("print(2)"))
 
 
+class TestMeta(unittest.TestCase):
+
+    def tearDown(self):
+        import yurlungur
+        from yurlungur.core import backend
+        from yurlungur.tool.meta import meta
+
+        yurlungur.use("yurlungur.tool.standalone")
+        self.assertFalse(getattr(meta, "getcwd", False))
+        self.assertFalse(hasattr(yurlungur, "getcwd"))
+        self.assertFalse(hasattr(yurlungur, "AbcImport"))
+        self.assertEqual(type(backend.host), backend.Backend)
+
+    def test_use(self):
+        import yurlungur
+        from yurlungur.tool.meta import meta
+
+        self.assertFalse(getattr(meta, "getcwd", False))
+        yurlungur.use("os")
+        self.assertTrue(getattr(meta, "getcwd", False))
+        self.assertIn("getcwd", meta.__dict__)
+
+    def test_use_plugin(self):
+        import types
+        import yurlungur
+        from yurlungur.tool.meta import meta
+
+        fake = types.ModuleType("fake_app")
+        sys.modules[fake.__name__] = fake
+        try:
+            yurlungur.use(fake.__name__)
+            self.assertFalse(meta.AbcImport)
+            fake.AbcImport = lambda *args: True
+            self.assertTrue(meta.AbcImport())
+        finally:
+            del sys.modules[fake.__name__]
+
+    def test_use_backend(self):
+        import types
+        import yurlungur
+        from yurlungur.core import backend
+
+        fake = types.ModuleType("fake_maya")
+        fake.getAttr = lambda *args, **kwargs: None
+        sys.modules[fake.__name__] = fake
+        try:
+            yurlungur.use(fake.__name__)
+            self.assertEqual(type(backend.host).__name__, "Maya")
+        finally:
+            del sys.modules[fake.__name__]
+
+
+class TestProxy(unittest.TestCase):
+
+    def test_slots(self):
+        from yurlungur.core.proxy import Object, Node, Attribute, File
+
+        for cls in Object, Node, Attribute, File:
+            self.assertEqual(cls.__dictoffset__, 0)
+
+    def test_walk(self):
+        from yurlungur.core.backend import Backend
+
+        class Tree(Backend):
+            def hierarchy(self, obj):
+                return [("a", "root"), ("b", "a"), ("c", "b"), ("d", "root")]
+
+        tree = Tree()
+        self.assertRaises(Exception, list, tree.find("leaf", obj=tree.Node("root")))
+        tree.node_type = lambda obj: "leaf" if obj.name in "cd" else "group"
+        self.assertEqual(list(tree.find("leaf", obj=tree.Node("root"))), ["c", "d"])
+        self.assertEqual([e.name for e in tree.walk(None)], ["a", "d", "b", "c"])
+        self.assertEqual([e.name for e in tree.walk(None, order="dfs")], ["a", "b", "c", "d"])
+        self.assertEqual([e.name for e in tree.walk(None, depth=1)], ["a", "d"])
+        self.assertEqual([e.parent for e in tree.walk(None, filter=lambda e: e.depth > 1)], ["a", "b"])
+
+    def test_query(self):
+        from yurlungur.core import backend
+        from yurlungur.core.query import Query
+
+        class Scene(backend.Backend):
+            scene_events = True
+            pulls = 0
+
+            def scene(self, obj=None):
+                Scene.pulls += 1
+                return [("|root", "", "transform"), ("|root|body", "|root", "mesh"),
+                        ("|root|arm", "|root", "mesh"), ("|root|leg", "|root", "mesh")]
+
+            def get_attrs(self, obj, names=None):
+                return {"tx": len(obj.item)}
+
+            def identity(self, item):
+                raise AssertionError("id of %s is fetched alone" % item)
+
+            def identities(self, names):
+                return dict((name, hash(name)) for name in names)
+
+        host, backend.host = backend.host, Scene()
+        try:
+            meshes = Query(type="mesh")
+            self.assertEqual(list(meshes.names()), ["|root|body", "|root|arm", "|root|leg"])
+            self.assertIs(list(meshes)[1], Query(type="mesh", pattern="*arm")[0])
+            self.assertEqual(list(meshes.name("arm").names()), ["|root|arm"])
+            self.assertEqual(list(meshes.match("a").names()), ["|root|arm"])
+            self.assertEqual(list(meshes.where(tx=lambda v: v > 9).names()), ["|root|body"])
+            self.assertEqual([page.names for page in meshes.pages(2)], [["|root|body", "|root|arm"], ["|root|leg"]])
+            self.assertEqual(meshes[1:].names, ["|root|arm", "|root|leg"])
+            self.assertEqual(meshes[-1].name, "|root|leg")
+            self.assertEqual(meshes[-2:].names, ["|root|arm", "|root|leg"])
+            self.assertRaises(IndexError, lambda: meshes[-4])
+            self.assertEqual(Scene.pulls, 1)
+
+            Scene.scene_events = False
+            list(meshes.names())
+            list(meshes.names())
+            self.assertEqual(Scene.pulls, 3)
+        finally:
+            backend.host.unwatch()
+            backend.host = host
+
+    def test_selection(self):
+        from yurlungur.core.backend import Backend
+
+        class Watched(Backend):
+            def watch_selection(self):
+                return True
+
+        queries = []
+        query = lambda: queries.append(1) or len(queries)
+
+        self.assertEqual([Backend().selection(query) for _ in range(2)], [1, 2])
+        host = Watched()
+        self.assertEqual([host.selection(query) for _ in range(2)], [3, 3])
+        host.selection_changed()
+        self.assertEqual(host.selection(query), 4)
+
+
+    def test_sample(self):
+        from yurlungur.core import backend
+
+        class Sampler(backend.Backend):
+            def sample(self, obj, names, frames):
+                return [[backend._flat(frame)[0]] for frame in frames]
+
+        host, backend.host = backend.host, Sampler()
+        try:
+            frames = backend.host.Node("cube").sample_attrs(["tx"], (1, 2, 0.1))
+            self.assertEqual(len(frames), 11)
+            self.assertAlmostEqual(float(frames[-1][0]), 2.0)
+            self.assertEqual(backend._flat([(1, 2), 3]), [1.0, 2.0, 3.0])
+            self.assertRaises(Exception, backend._flat, ["text"])
+        finally:
+            backend.host = host
+
+    def test_has_attr(self):
+        from yurlungur.core.backend import Backend
+
+        class Spare(Backend):
+            spare = []
+
+            def exists(self, obj, val):
+                return val in self.spare
+
+        host = Spare()
+        node = host.Node("/obj/geo1")
+        self.assertFalse(host.has_attr(node, "foo"))
+        Spare.spare.append("foo")
+        self.assertTrue(host.has_attr(node, "foo"))
+
+    def test_set_many(self):
+        from yurlungur.core import backend
+        from yurlungur.core.command import attr
+
+        class Writer(backend.Backend):
+            writes = []
+
+            def set_attrs(self, obj, values):
+                Writer.writes.append((obj.name, values))
+
+        host, backend.host = backend.host, Writer()
+        try:
+            attr.set_many([("cube", "tx", 1.0), (backend.host.Node("cube"), "ty", 2.0), ("cone", "tx", 3.0)])
+            self.assertEqual(Writer.writes, [("cube", {"tx": 1.0, "ty": 2.0}), ("cone", {"tx": 3.0})])
+        finally:
+            backend.host = host
+
+    def test_network(self):
+        from yurlungur.core import backend
+        from yurlungur.core.network import Network
+
+        class Comp(backend.Backend):
+            def create_many(self, specs):
+                return [self.Node(name) for _, name, _, _ in specs]
+
+            def connect_many(self, links):
+                self.links = [(src.name, output, dst.name, input) for src, output, dst, input in links]
+
+        net = Network.from_dict({
+            "nodes": [{"type": "Loader", "name": "plate"}, {"type": "Blur", "name": "blur", "attrs": {"size": 2}}],
+            "connections": [{"source": "plate", "destination": "blur"}, {"source": "blur", "destination": "Out"}],
+        })
+        self.assertEqual(Network.from_dict(net.to_dict()).to_dict(), net.to_dict())
+        self.assertRaises(Exception, net.node, "Blur", "blur")
+
+        host, backend.host = backend.host, Comp()
+        try:
+            self.assertEqual(net.build().names, ["plate", "blur"])
+            self.assertEqual(backend.host.links, [("plate", None, "blur", None), ("blur", None, "Out", None)])
+        finally:
+            backend.host = host
+
+
+class TestGraph(unittest.TestCase):
+
+    def test_graph(self):
+        import pickle
+        from yurlungur.core.graph import Graph
+
+        graph = Graph.from_edges(["a", "b", "c", "d"], [("a", "b"), ("b", "c"), ("a", "d"), ("d", "c")])
+        self.assertEqual(list(graph.indptr), [0, 2, 3, 3, 4])
+        self.assertEqual(graph.topological(), ["a", "b", "d", "c"])
+        self.assertEqual(graph.upstream("c"), ["a", "b", "d"])
+        self.assertEqual(graph.downstream("b"), ["c"])
+        self.assertEqual(graph.inputs("c"), ["b", "d"])
+        self.assertTrue(graph.acyclic)
+        self.assertEqual(pickle.loads(pickle.dumps(graph)).edges, graph.edges)
+
+        graph = Graph.from_edges([], [("a", "b"), ("b", "c"), ("c", "b")])
+        self.assertEqual(graph.cycle(), ["b", "c"])
+        self.assertRaises(Exception, graph.topological)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot(self):
+        import os
+        import pickle
+        import tempfile
+        from yurlungur.core.store import Snapshot
+
+        snap = Snapshot.build(
+            [("|root", None, "transform"), ("|root|body", "|root", "mesh"), ("|root|arm", "|root", "mesh")],
+            {"tx": [0.0, 1.0, None], "material": ["", "skin", "skin"]}
+        )
+        self.assertEqual(snap.select(type="mesh", pattern="*body*"), ["|root|body"])
+        self.assertEqual(snap.select(material="skin"), ["|root|body", "|root|arm"])
+        self.assertEqual(snap.parent("|root|arm"), "|root")
+        self.assertEqual(snap.children("|root"), ["|root|body", "|root|arm"])
+        self.assertEqual(snap.values("|root|arm"), {"tx": None, "material": "skin"})
+        self.assertEqual(list(pickle.loads(pickle.dumps(snap))), list(snap))
+
+        path = os.path.join(tempfile.mkdtemp(), "scene.snap")
+        self.assertEqual(Snapshot.load(snap.save(path)).value("|root|body", "tx"), 1.0)
+
+    def test_capture(self):
+        import yurlungur.core.proxy
+        from yurlungur.core import backend
+        from yurlungur.core.store import Snapshot
+
+        class Scene(backend.Backend):
+            def scene(self, obj=None):
+                return [("|a", "", "transform"), ("|a|b", "|a", "mesh")]
+
+            def identities(self, names):
+                calls.append(list(names))
+                return {}
+
+            def get_attrs(self, obj, names):
+                return {"tx": len(obj.name)}
+
+        calls = []
+        previous, backend.host = backend.host, Scene()
+        try:
+            snap = Snapshot.capture(attrs=["tx"])
+        finally:
+            backend.host = previous
+        self.assertEqual(calls, [["|a", "|a|b"]])
+        self.assertEqual(snap.values("|a|b"), {"tx": 4})
+
+    def test_diff(self):
+        from yurlungur.core.store import Snapshot
+
+        old = Snapshot.build(
+            [("|root", None, "transform"), ("|root|body", "|root", "mesh"), ("|root|arm", "|root", "mesh"),
+             ("|root|arm|hand", "|root|arm", "mesh"), ("|cam", None, "camera")],
+            {"tx": [0.0, 1.0, 2.0, 3.0, 4.0]}
+        )
+        new = Snapshot.build(
+            [("|root", None, "transform"), ("|root|body", "|root", "mesh"), ("|root|limb", "|root", "mesh"),
+             ("|root|limb|hand", "|root|limb", "mesh"), ("|light", None, "light")],
+            {"tx": [0.0, 5.0, 2.0, 3.0, 4.0]}
+        )
+        diff = old.diff(new)
+        self.assertEqual(diff.added, ["|light"])
+        self.assertEqual(diff.removed, ["|cam"])
+        self.assertEqual(diff.renamed, {"|root|arm": "|root|limb", "|root|arm|hand": "|root|limb|hand"})
+        self.assertEqual(diff.changed, {"|root|body": {"tx": (1.0, 5.0)}})
+        self.assertFalse(old.diff(old))
+
+        moved = Snapshot.build([("|grp", None, "transform"), ("|grp|b", "|grp", "transform")])
+        diff = Snapshot.build([("|grp", None, "transform"), ("|a", None, "transform")]).diff(moved)
+        self.assertEqual((diff.added, diff.removed, diff.renamed), (["|grp|b"], ["|a"], {}))
+
+
+class TestKeyframe(unittest.TestCase):
+
+    def test_curve(self):
+        import pickle
+        from yurlungur.core.keyframe import Curve
+
+        curve = Curve([1, 2, 3], [0.0, 1.0, 4.0], [0.0, 1.0, 2.0], [1.0, 2.0, 0.0])
+        retimed = curve.retime(offset=-1, scale=2.0)
+        self.assertEqual(list(retimed.times), [1.0, 3.0, 5.0])
+        self.assertEqual(list(retimed.out_slopes), [0.5, 1.0, 0.0])
+        self.assertEqual(list(pickle.loads(pickle.dumps(curve)).values), [0.0, 1.0, 4.0])
+        self.assertIsNone(Curve([1], [0.0]).in_slopes)
+
+
+class TestEvent(unittest.TestCase):
+
+    def test_bus(self):
+        from yurlungur.core import event
+        from yurlungur.core.backend import Backend
+
+        bus = event.EventBus()
+        batches = []
+        bus.subscribe(lambda kind, names: batches.append((kind, names)), kinds=[event.ADDED, event.CHANGED])
+
+        with bus.hold():
+            for name in "|a", "|b", "|a", "|c":
+                bus.emit(event.ADDED, name)
+            bus.emit(event.REMOVED, "|c")
+            bus.emit(event.CHANGED, "|a")
+            bus.emit(event.SAVED)
+            self.assertEqual(batches, [])
+        self.assertEqual(batches, [(event.ADDED, ["|a", "|b"]), (event.CHANGED, ["|a"])])
+
+        host = Backend()
+        host._rows = {None: [], "|a": [], "|b": []}
+        host.changed(event.REMOVED, ["|a|x"])
+        self.assertEqual(list(host._rows), ["|b"])
+
+    def test_debounce(self):
+        import time
+        from yurlungur.core import event
+
+        bus = event.EventBus(delay=0.01)
+        batches = []
+        bus.subscribe(lambda kind, names: batches.append((kind, names)))
+        for name in "|a", "|b":
+            bus.emit(event.ADDED, name)
+        self.assertEqual(batches, [])
+
+        deadline = time.time() + 2.0
+        while not batches and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(batches, [(event.ADDED, ["|a", "|b"])])
+
+    def test_unwatch(self):
+        from yurlungur.core import event
+        from yurlungur.core.backend import Backend
+
+        removed = []
+        host = Backend()
+        host.hook(lambda: removed.append(True))
+        host.listen()
+        self.assertIn(host.changed, [fn for fn, _ in event.bus._subscribers])
+        host.unwatch()
+        self.assertEqual(removed, [True])
+        self.assertNotIn(host.changed, [fn for fn, _ in event.bus._subscribers])
+
+    def test_watch_node(self):
+        import yurlungur.core.proxy
+        from yurlungur.core import event
+        from yurlungur.core.backend import Backend, LAZY
+
+        class Host(Backend):
+            fetched = 0
+
+            def fetch(self, attr):
+                self.fetched += 1
+                return self.fetched
+
+            def watch_node(self, name, emit):
+                watched.append(name)
+                return lambda: removed.append(name)
+
+        watched, removed = [], []
+        host = Host()
+        try:
+            with host.cached():
+                tx = host.Attribute(LAZY, "|a", "tx")
+                self.assertEqual(host.raw(tx), 1)
+                self.assertEqual(host.raw(host.Attribute(LAZY, "|a", "ty")), 2)
+                self.assertEqual(host.raw(tx), 1)
+                host.changed(event.CHANGED, ["|a"])
+                self.assertEqual(host.raw(tx), 3)
+                self.assertEqual((watched, removed), (["|a"], []))
+            self.assertEqual(removed, ["|a"])
+            self.assertEqual(host.raw(tx), 4)
+            self.assertEqual(watched, ["|a"])
+        finally:
+            host.unwatch()
+
+
+
+class TestGeometry(unittest.TestCase):
+
+    def test_duplicates(self):
+        import yurlungur.core.proxy
+        from yurlungur.core import backend, env, geometry
+        from yurlungur.core.exception import YGeometryException
+
+        if not env.Numpy():
+            self.skipTest("numpy is not installed")
+
+        import numpy as np
+
+        class Scene(backend.Backend):
+            def get_geometry(self, obj):
+                if obj.name == "|cam":
+                    raise YGeometryException(obj.name)
+                uvs = [[0, 0], [1, 0], [0, 1]] if obj.name != "|c" else [[0, 0], [0, 1], [1, 0]]
+                return {
+                    "points": np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], np.float32),
+                    "normals": np.array([[0, 0, 1]] * 3, np.float32),
+                    "uvs": np.array(uvs, np.float32),
+                    "counts": np.array([3], np.int32),
+                    "indices": np.array([0, 1, 2], np.int32),
+                }
+
+        previous, backend.host = backend.host, Scene()
+        try:
+            groups = geometry.duplicates(["|a", "|cam", "|b", "|c"])
+        finally:
+            backend.host = previous
+        self.assertEqual([[node.name for node in group] for group in groups], [["|a", "|b"]])
+
+
+class TestTransform(unittest.TestCase):
+
+    def test_world(self):
+        from yurlungur.core import env, transform
+        from yurlungur.core.store import Snapshot
+
+        if not env.Numpy():
+            self.skipTest("numpy is not installed")
+
+        import numpy as np
+        local = transform.compose([[1, 0, 0], [0, 1, 0], [0, 0, 1]], [[0, 0, np.pi / 2], [0, 0, 0], [0, 0, 0]], [[2, 2, 2], [1, 1, 1], [1, 1, 1]])
+        snap = Snapshot.build(
+            [("|root", None, "transform"), ("|root|arm", "|root", "transform"), ("|root|arm|hand", "|root|arm", "transform")],
+            {"matrix": [tuple(m) for m in local.reshape(-1, 16)]}
+        )
+        self.assertEqual(list(transform.levels(snap.parents)), [0, 1, 2])
+        translate, rotate, scale = transform.decompose(snap.world_matrices(), degrees=True)
+        self.assertTrue(np.allclose(translate, [[1, 0, 0], [-1, 0, 0], [-1, 0, 2]]))
+        self.assertTrue(np.allclose(rotate, [[0, 0, 90]] * 3))
+        self.assertTrue(np.allclose(scale, [[2, 2, 2]] * 3))
+
+        for order in range(6):
+            matrices = transform.compose(translate, np.radians([[10, 80, -30]] * 3), scale, order)
+            self.assertTrue(np.allclose(transform.compose(*transform.decompose(matrices, order), order=order), matrices))
+
+
 if __name__ == '__main__':
     unittest.main()
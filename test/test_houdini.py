@@ -21,6 +21,46 @@ class TestHoudini(unittest.TestCase):
     def test_attr(self):
         yr.Node('obj').create('geo')
 
+    @unittest.skip("only runtime")
+    def test_get_attrs(self):
+        geo = yr.Node('obj').create('geo')
+        attrs = geo.snapshot_attrs()
+        self.assertEqual(geo.get_attrs(['tx', 'ty']), {'tx': attrs['tx'], 'ty': attrs['ty']})
+
+    @unittest.skip("only runtime")
+    def test_spare_parm(self):
+        import hou
+        from yurlungur.core import backend
+        geo, other = yr.Node('obj').create('geo'), yr.Node('obj').create('geo')
+        native = hou.node(geo.name)
+        group = native.parmTemplateGroup()
+        group.append(hou.FloatParmTemplate("spare", "Spare", 1))
+        native.setParmTemplateGroup(group)
+        self.assertIn("tx", dir(other))
+        self.assertTrue(backend.host.has_attr(geo, "spare"))
+        self.assertNotIn("spare", dir(other))
+        self.assertFalse(backend.host.has_attr(other, "spare"))
+
+    @unittest.skip("only runtime")
+    def test_create_many(self):
+        nodes = yr.Node.create_many([("geo", "geo%d" % i, "/obj", {"tx": i}) for i in range(100)])
+        self.assertEqual(len(nodes), 100)
+        self.assertEqual(list(nodes.attr("tx").values), list(range(100)))
+
+    @unittest.skip("only runtime")
+    def test_sample(self):
+        geo = yr.Node('obj').create('geo')
+        geo.tx.set(2.0)
+        self.assertEqual(geo.sample_attrs(['tx', 't'], (1, 10)).shape, (10, 4))
+        self.assertEqual(list(geo.tx.sample([1, 5]).ravel()), [2.0, 2.0])
+
+    @unittest.skip("only runtime")
+    def test_geometry(self):
+        box = yr.Node('obj').create('geo').create('box')
+        geo = box.geometry
+        self.assertEqual(geo.points.shape, (8, 3))
+        self.assertEqual(len(geo.faces), 6)
+
     @unittest.skip("")
     def test_file(self):
         yr.File.save('temp.hip')
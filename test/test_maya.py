@@ -105,5 +105,56 @@ class TestMaya(unittest.TestCase):
         print(end)
 
 
+    @unittest.skip("only runtime")
+    def test_node_array(self):
+        for _ in range(1000):
+            yr.maya.polyCube()
+        start = time()
+        cubes = yr.node.ls("pCube*", type="transform")
+        tx = cubes.attr("tx").values
+        cubes.attr("tx").set([v + ru(-5, 5) for v in tx])
+        print(cubes.attr("tx"))
+        end = time() - start
+        print(end)
+
+    @unittest.skip("only runtime")
+    def test_get_attrs(self):
+        cube = yr.Node(yr.maya.polyCube()[0])
+        yr.maya.setAttr(cube.name + ".tx", 3.0)
+        self.assertEqual(cube.get_attrs(["tx", "translateY"]), {"tx": 3.0, "translateY": 0.0})
+        self.assertEqual(list(yr.node.query(type="transform", tx=3.0).names()), [yr.maya.ls(cube.name, long=True)[0]])
+
+    @unittest.skip("only runtime")
+    def test_column(self):
+        from yurlungur.core.proxy import NodeArray
+        a, b = yr.maya.polyCube()[0], yr.maya.polyCube()[0]
+        column = NodeArray([yr.Node(a), yr.Node(b), yr.Node(a)]).attr("tx")
+        column.set([1.0, 2.0, 3.0])
+        self.assertEqual(list(column.values), [3.0, 2.0, 3.0])
+
+    @unittest.skip("only runtime")
+    def test_keys(self):
+        cube = yr.maya.polyCube()[0]
+        for frame, value in (1, 0.0), (10, 90.0), (20, 45.0):
+            yr.maya.setKeyframe(cube, at="rotateX", t=frame, v=value)
+        curves = yr.keyframe.read(cube, ["rotateX"])
+        yr.keyframe.write(cube, curves)
+        self.assertEqual(yr.maya.keyframe(cube + ".rotateX", q=True, valueChange=True), [0.0, 90.0, 45.0])
+
+    @unittest.skip("only runtime")
+    def test_instance_duplicates(self):
+        cubes = [yr.maya.polyCube()[0] for _ in range(10)]
+        yr.maya.move(0, 5, 0, cubes[1])
+        self.assertEqual(len(yr.geometry.duplicates(cubes)), 1)
+        instances = yr.geometry.instance_duplicates(cubes)
+        self.assertEqual(len(instances), 9)
+        self.assertEqual(yr.maya.xform(instances[cubes[1]].name, q=True, ws=True, t=True), [0, 5, 0])
+
+        shapes = yr.maya.listRelatives(yr.maya.polyCube()[0], yr.maya.polyCube()[0], s=True, f=True)
+        instances = yr.geometry.instance_duplicates(shapes)
+        self.assertEqual(len(yr.maya.listRelatives(instances[shapes[1]].name, s=True)), 1)
+        self.assertTrue(yr.maya.listRelatives(shapes[0], ap=True, f=True)[1:])
+
+
 if __name__ == '__main__':
     unittest.main()
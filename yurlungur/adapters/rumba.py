@@ -29,6 +29,11 @@ class Layer(object):
 
 
 class Keyframe(object):
+    """
+    keys of an animation layer.
+    curve arrays of yurlungur.keyframe are not supported on rumba yet.
+    """
+
     def __init__(self, layer):
         from yurlungur.tool.meta import meta
         self.layer = layer
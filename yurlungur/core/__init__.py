@@ -9,6 +9,9 @@ if env.Maya() or env.Houdini() or env.Substance() or env.Nuke() or env.Davinci()
     from yurlungur.core.proxy import Node
 else:
     from yurlungur.core.proxy import Object as Node
-from yurlungur.core.proxy import File
+from yurlungur.core.proxy import File, NodeArray
+from yurlungur.core import geometry, keyframe, transform
+from yurlungur.core.network import Network
+from yurlungur.core.store import Snapshot, snapshot
 
-del app, command, deco, proxy
+del app, backend, command, deco, graph, network, proxy, query, store
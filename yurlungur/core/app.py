@@ -107,6 +107,12 @@ def use(module):
 
     assert application, "application is not found."
 
+    from yurlungur.tool.meta import meta
+    from yurlungur.core import backend
+
+    meta.invalidate()
+    backend.resolve()
+
 
 def initialize():
     """
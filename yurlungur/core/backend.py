@@ -0,0 +1,3644 @@
+# -*- coding: utf-8 -*-
+"""
+host backend for proxy objects.
+
+the host application is resolved once at import,
+so Object, Node, Attribute and File call straight into
+the implementation of the current host without probing meta.
+"""
+import os
+import math
+import fnmatch
+import inspect
+import weakref
+import threading
+import contextlib
+from functools import partial
+from collections import namedtuple, deque
+
+from yurlungur.core import app, env, event
+from yurlungur.core.exception import YException, YGeometryException
+from yurlungur.tool.meta import meta
+
+__all__ = ["Backend", "Field", "Entry", "host", "resolve"]
+
+_HOSTS_ = []
+
+
+def register(marker):
+    """
+    register host backend
+
+    Args:
+        marker: str attribute which only the host module has
+
+    Returns: class decorator
+    """
+
+    def _register(cls):
+        cls.marker = marker
+        _HOSTS_.append(cls)
+        return cls
+
+    return _register
+
+
+def _not_found(self, *args, **kwargs):
+    raise YException("api is not found")
+
+
+# value slot of Attribute which is not fetched yet
+LAZY = object()
+
+# attribute of node type schema
+Field = namedtuple("Field", "name type default size")
+
+
+class Entry(namedtuple("Entry", "name parent depth")):
+    """node of hierarchy walk, the wrapper is made on demand"""
+    __slots__ = ()
+
+    @property
+    def node(self):
+        return Backend.Node(self.name)
+
+
+def _leaf(name):
+    """short name of maya and houdini paths"""
+    for sep in "|/":
+        name = name.rsplit(sep, 1)[-1]
+    return name
+
+
+def _match(name, pattern):
+    return fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(_leaf(name), pattern)
+
+
+def _flat(value):
+    """float channels of number, vector or matrix"""
+    if isinstance(value, (int, float)):
+        return [float(value)]
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        raise YException("%r is not numeric channel" % (value,))
+    return [channel for item in value for channel in _flat(item)]
+
+
+def _numpy():
+    np = env.Numpy()
+    if not np:
+        raise YException("numpy is required")
+    return np
+
+
+def _name(obj):
+    return getattr(obj, "name", obj)
+
+
+def _field(name, value=None, size=1):
+    kind = type(value) if isinstance(value, (bool, int, float, str)) else None
+    return Field(name, kind, value, size)
+
+
+class Backend(object):
+    """
+    standalone backend.
+    every host overrides operations which are supported.
+    """
+    marker = None
+    # watch reports nodes added, removed and renamed, so the scene index can be kept
+    scene_events = False
+
+    # Monkey-Patch by yurlungur.core.proxy
+    Object = Node = Attribute = None
+
+    def __init__(self):
+        self.app = app.application
+        self._nodes = weakref.WeakValueDictionary()
+        self._ids = {}
+        self._schemas = {}
+        self._rows = {}
+        self._selection = None
+        self._watching = None
+        self._listening = False
+        self._hooks = []
+        # host callbacks may arrive from other threads
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return "<%s backend>" % self.__class__.__name__
+
+    @staticmethod
+    def _sel():
+        from yurlungur.core.command import node
+        return node.sel
+
+    def _attribute(self, value, obj, val):
+        attr = self.Attribute(value, obj.name, val)
+        attr.node = obj
+        return attr
+
+    def _plug(self, obj, val):
+        return self._attribute(LAZY, obj, val)
+
+    # identity
+    def identity(self, item):
+        """
+        host unique id of item (uuid, session id, instance id or guid).
+        hosts which have no stable id return None, and their nodes are not shared.
+        """
+        return None
+
+    def identities(self, names):
+        """
+        {name: host id} of many names in one call.
+        names which are missing fall back to identity.
+        """
+        return {}
+
+    def nodes(self, names, ids=None):
+        """
+        Node of every name, host ids are fetched together instead of per node.
+
+        Args:
+            names: node names
+            ids: host ids in the order of names, fetched by identities when None
+
+        Returns: list of Node
+        """
+        names = list(names)
+        self._ids = dict(zip(names, ids)) if ids is not None else self.identities(names)
+        try:
+            return [self.Node(name) for name in names]
+        finally:
+            self._ids = {}
+
+    def intern(self, cls, item):
+        """
+        wrapper of item from identity map.
+
+        Args:
+            cls: Node class
+            item: name or native object
+
+        Returns: new or alive wrapper which has the same identity
+        """
+        if item is None:
+            key = None
+        elif self._ids and item in self._ids:
+            key = self._ids[item]
+        else:
+            key = self.identity(item)
+        if key is None:
+            return super(self.Node, cls).__new__(cls)
+
+        key = cls, key
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = super(self.Node, cls).__new__(cls)
+        return node
+
+    # native handle
+    def lookup(self, name):
+        """
+        resolve native object from name.
+        hosts which are driven by names return None.
+        """
+        return None
+
+    def alive(self, obj, handle):
+        """cheap staleness check of cached native object"""
+        return True
+
+    def handle(self, obj):
+        """
+        native object of obj.
+        resolved once and kept on obj until rename, delete or validation fails.
+        """
+        handle = obj._handle
+        if handle is None or not self.alive(obj, handle):
+            handle = obj._handle = self.lookup(obj.name)
+        return handle
+
+    def owner(self, attr):
+        """native object which attr belongs to"""
+        if attr.node is not None:
+            return self.handle(attr.node)
+        return self.lookup(attr.obj)
+
+    def release(self, obj, name=None):
+        """drop cached native object, and follow the new name if given"""
+        obj._handle = None
+        obj._probes = None
+        if name is not None:
+            obj.item = name
+
+    # schema
+    def node_type(self, obj):
+        """
+        key of the attribute layout which nodes share.
+        hosts which can not tell return None, and schema is built for every node.
+        """
+        return None
+
+    def describe(self, obj):
+        """introspect attributes of obj into {name: Field}"""
+        names = (a[0] if isinstance(a, tuple) else a for a in self.attrs(obj) or ())
+        return dict((name, _field(name)) for name in names)
+
+    def schema(self, obj):
+        """
+        {name: Field} of obj.
+        built once per node type and kept on the wrapper.
+        """
+        schema = obj._schema
+        if schema is not None:
+            return schema
+
+        kind = self.node_type(obj)
+        if kind is None:
+            return self.describe(obj)
+
+        schema = self._schemas.get(kind)
+        if schema is None:
+            schema = self._schemas[kind] = self.describe(obj)
+        obj._schema = schema
+        return schema
+
+    def field(self, attr):
+        """Field of attr, None when it is not in the schema"""
+        node = attr.node if attr.node is not None else self.Node(attr.obj)
+        return self.schema(node).get(attr.val)
+
+    def exists(self, obj, val):
+        """direct host probe for attributes which are out of the schema"""
+        names = (a[0] if isinstance(a, tuple) else a for a in self.attrs(obj) or ())
+        return val in names
+
+    def has_attr(self, obj, val):
+        """
+        existence of attribute, memoized on the wrapper.
+        the schema answers first, then the host is probed.
+        only found names are kept, attributes added later are probed again.
+        """
+        probes = obj._probes
+        if probes is None:
+            probes = obj._probes = set()
+
+        if val in probes:
+            return True
+        found = val in self.schema(obj) or bool(self.exists(obj, val))
+        if found:
+            probes.add(val)
+        return found
+
+    # Object
+    def setup(self, obj):
+        pass
+
+    def repr(self, obj):
+        return obj.name
+
+    def name(self, obj):
+        return obj.item
+
+    def id(self, obj):
+        return None
+
+    def rename(self, obj, *args, **kwargs):
+        return None
+
+    def attr(self, obj, val, *args, **kwargs):
+        return None
+
+    def attrs(self, obj, *args, **kwargs):
+        return None
+
+    def create(self, obj, *args, **kwargs):
+        return None
+
+    def delete(self, obj, *args, **kwargs):
+        return None
+
+    def instance(self, obj, *args, **kwargs):
+        return None
+
+    def replace_with_instance(self, master, target):
+        """
+        put instance of master where target is and delete target.
+        name, parent and world transform of target are kept.
+
+        Returns: Node of instance
+        """
+        raise YException("instancing is not supported on %s" % self)
+
+    def select(self, obj, *args, **kwargs):
+        return None
+
+    def hide(self, obj, on=True):
+        return None
+
+    def parent(self, obj, *args, **kwargs):
+        return None
+
+    def children(self, obj, *args, **kwargs):
+        return None
+
+    def create_many(self, specs):
+        """
+        create nodes in one pass.
+        the caller opens the undo step.
+
+        Args:
+            specs: [(type, name, parent, {attr: value}), ...]
+
+        Returns: list of Node
+        """
+        nodes = []
+        for kind, name, parent, attrs in specs:
+            node = self.create(self.Node(_name(parent)), kind)
+            if name and node is not None:
+                self.rename(node, name)
+            if attrs and node is not None:
+                self.set_attrs(node, attrs)
+            nodes.append(node)
+        return nodes
+
+    def build(self, specs, links):
+        """
+        create nodes then connect them after all of them exist.
+        the caller opens the undo step.
+
+        Args:
+            specs: [(type, name, parent, {attr: value}), ...]
+            links: [(source, destination, input, output), ...] names in specs or in the scene
+
+        Returns: list of Node
+        """
+        nodes = self.create_many(specs)
+        created = dict((spec[1], node) for spec, node in zip(specs, nodes) if spec[1])
+
+        def resolve(name):
+            return created[name] if name in created else self.Node(name)
+
+        if links:
+            self.connect_many([(resolve(src), output, resolve(dst), input) for src, dst, input, output in links])
+        return nodes
+
+    def connect_many(self, links):
+        """
+        Args:
+            links: [(source Node, output, destination Node, input), ...]
+        """
+        raise YException("connect_many is not supported on %s" % self)
+
+    def depth(self, obj):
+        """hierarchy depth of obj, 0 when the host is flat"""
+        return 0
+
+    def delete_many(self, nodes):
+        """
+        delete nodes, children before parents.
+        every node is tried, the caller opens the undo step.
+
+        Args:
+            nodes: list of Node
+
+        Returns: {name: error} of nodes which are not deleted
+        """
+        failures = {}
+        for node in sorted(nodes, key=self.depth, reverse=True):
+            try:
+                self.delete(node)
+            except Exception as e:
+                failures[node.name] = e
+        return failures
+
+    def hierarchy(self, obj):
+        """
+        (name, parent name) of every descendant of obj.
+        hosts override this to pull the tree with a few calls.
+        """
+        pairs = []
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            for child in self.children(node) or ():
+                child = child if isinstance(child, self.Object) else self.Node(child)
+                pairs.append((child.name, node.name))
+                stack.append(child)
+        return pairs
+
+    def walk(self, obj, depth=None, order="bfs", filter=None):
+        """
+        traverse descendants of obj from one hierarchy pull
+
+        Args:
+            obj: root Node
+            depth: max depth, None is unlimited
+            order: "bfs" or "dfs" (pre-order)
+            filter: callable which takes Entry
+
+        Returns: generator of Entry
+        """
+        if order not in ("bfs", "dfs"):
+            raise YException("order is bfs or dfs: %s" % order)
+
+        pairs = self.hierarchy(obj)
+        names = set(name for name, _ in pairs)
+        tree = {}
+        top = []
+        for name, parent in pairs:
+            if parent in names:
+                tree.setdefault(parent, []).append(name)
+            else:
+                top.append(Entry(name, parent, 1))
+
+        pending = deque(top) if order == "bfs" else list(reversed(top))
+        pop = pending.popleft if order == "bfs" else pending.pop
+        while pending:
+            entry = pop()
+            if filter is None or filter(entry):
+                yield entry
+
+            if depth is None or entry.depth < depth:
+                children = [Entry(name, entry.name, entry.depth + 1) for name in tree.get(entry.name, ())]
+                pending.extend(children if order == "bfs" else reversed(children))
+
+    def scene(self, obj=None):
+        """
+        (name, parent name, type) of nodes under obj, or of the whole scene when obj is None.
+        parent is "" for top nodes, type is "" when the host can not tell in the same pull,
+        then find asks node_type when a type is filtered.
+        """
+        if obj is not None:
+            return [(name, parent, "") for name, parent in self.hierarchy(obj)]
+
+        from yurlungur.core.command import node
+        return [(n.name, "", "") for n in node.ls() or ()]
+
+    def rows(self, obj=None):
+        """
+        scene rows which are kept until invalidate().
+        hosts which do not report scene events pull them every time.
+        """
+        if not self.scene_events:
+            return self.scene(obj)
+
+        key = _name(obj) if obj is not None else None
+        self.listen()
+        with self._lock:
+            if key not in self._rows:
+                self._rows[key] = self.scene(obj)
+            return self._rows[key]
+
+    def invalidate(self, names=None):
+        """
+        drop the name and type index after nodes are created, deleted or renamed
+
+        Args:
+            names: changed node names, everything when None
+        """
+        with self._lock:
+            if names is None or None in names:
+                self._rows.clear()
+                return
+            for key in list(self._rows):
+                if key is None or any(name.startswith(key) for name in names):
+                    del self._rows[key]
+
+    def listen(self):
+        """invalidate caches from host events from now on"""
+        if not self._listening:
+            self._listening = True
+            event.bus.subscribe(self.changed)
+
+    def changed(self, kind, names):
+        """subscriber of event.bus"""
+        with self._lock:
+            if kind == event.OPENED:
+                self._rows.clear()
+                self._schemas.clear()
+                self._selection = None
+            elif kind in (event.ADDED, event.REMOVED, event.RENAMED):
+                self.invalidate(names)
+            elif kind == event.CHANGED and self._cache:
+                # hosts send full paths, cached values may be keyed by short name
+                leaves = set(_leaf(name) for name in names if name is not None)
+                for key in [key for key in self._cache if None in names or _leaf(key[0]) in leaves]:
+                    del self._cache[key]
+
+    def watch(self, emit):
+        """
+        install host callbacks which call emit(kind, name)
+
+        Args:
+            emit: callable which takes event kind and node name
+
+        Returns: False when host has no callbacks
+        """
+        return False
+
+    def watch_node(self, name, emit):
+        """
+        install host callback which calls emit(CHANGED, name) when attributes of one node change
+
+        Returns: callable which removes it, None when host has no callback
+        """
+        return None
+
+    def defer(self, fn, delay):
+        """
+        call fn later on the main thread, through qt event loop when the host has one
+
+        Returns: False when host has no event loop
+        """
+        try:
+            from yurlungur.Qt import QtCore
+        except ImportError:
+            return False
+        if QtCore.QCoreApplication.instance() is None:
+            return False
+        QtCore.QTimer.singleShot(int(delay * 1000), fn)
+        return True
+
+    def hook(self, remove):
+        """keep remover of installed host callbacks for unwatch"""
+        self._hooks.append(remove)
+
+    def unwatch(self):
+        """remove host callbacks and bus subscription, called when this backend is replaced"""
+        while self._hooks:
+            try:
+                self._hooks.pop()()
+            except Exception:
+                pass
+        self._watching = None
+        self._selection = None
+        if self._listening:
+            event.bus.unsubscribe(self.changed)
+            self._listening = False
+
+    def selection(self, query):
+        """
+        selected nodes which are kept until the host reports selection change.
+        hosts which can not report it call query every time.
+
+        Args:
+            query: callable which reads the selection from the host
+
+        Returns: result of query
+        """
+        if self._watching is None:
+            self._watching = bool(self.watch_selection())
+        if not self._watching:
+            return query()
+        if self._selection is None:
+            self._selection = query()
+        return self._selection
+
+    def selection_changed(self, *args):
+        self._selection = None
+
+    def watch_selection(self):
+        """install host callback which calls selection_changed, return False when host has none"""
+        return False
+
+    def find(self, kind=None, pattern=None, obj=None):
+        """
+        names of nodes which match type and name pattern.
+        hosts override this to filter inside the host,
+        the base filters the kept scene rows.
+
+        Args:
+            kind: node type
+            pattern: fnmatch pattern of full or short name
+            obj: root Node, the whole scene when None
+
+        Returns: iterable of names
+        """
+        rows = self.rows(obj)
+        for index, (name, parent, node_type) in enumerate(rows):
+            if pattern is not None and not _match(name, pattern):
+                continue
+            if kind is not None:
+                if not node_type:
+                    # scene of this host has no types, ask once and keep it in the row
+                    node_type = self.node_type(self.Node(name))
+                    if node_type is None:
+                        raise YException("type filter is not supported on %s" % self)
+                    rows[index] = name, parent, node_type
+                if node_type != kind:
+                    continue
+            yield name
+
+    # Node
+    def connect(self, obj, *args, **kwargs):
+        return None
+
+    def disconnect(self, obj, *args, **kwargs):
+        return None
+
+    def inputs(self, obj, *args, **kwargs):
+        return None
+
+    def outputs(self, obj, *args, **kwargs):
+        return None
+
+    def connections(self, obj):
+        """
+        node names and (source, destination) edges of the network under obj.
+        hosts override this to read the whole network at once.
+        """
+        nodes = [
+            child if isinstance(child, self.Object) else self.Node(child)
+            for child in self.children(obj) or ()
+        ]
+        edges = []
+        for node in nodes:
+            for src in self.inputs(node) or ():
+                edges.append((_name(src), node.name))
+        return [node.name for node in nodes], edges
+
+    # Attribute
+    _cache = None
+    _tracked = None
+
+    @contextlib.contextmanager
+    def cached(self):
+        """
+        keep fetched values until the outermost block ends.
+        nodes read inside the block are watched until it ends.
+        """
+        if self._cache is not None:
+            yield self._cache
+            return
+
+        self.listen()
+        self._cache = {}
+        self._tracked = {}
+        try:
+            yield self._cache
+        finally:
+            with self._lock:
+                self._cache = None
+                tracked, self._tracked = self._tracked, None
+            for remove in tracked.values():
+                if remove is not None:
+                    try:
+                        remove()
+                    except Exception:
+                        pass
+
+    def forget(self, name, vals):
+        """drop cached values which are written"""
+        with self._lock:
+            if self._cache:
+                for val in vals:
+                    self._cache.pop((name, val), None)
+
+    def fetch(self, attr):
+        """read the host value of a lazy attribute"""
+        return None
+
+    def raw(self, attr):
+        """
+        host value behind attr.
+        lazy attributes fetch on every access, or once inside cached().
+        """
+        value = attr._values[0]
+        if value is not LAZY:
+            return value
+
+        if self._cache is None:
+            return self.fetch(attr)
+
+        key = attr.obj, attr.val
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        if attr.obj not in self._tracked:
+            # watch before the read, a change in between drops the value
+            self._tracked[attr.obj] = self.watch_node(attr.obj, event.bus.emit)
+        value = self.fetch(attr)
+        with self._lock:
+            if self._cache is not None:
+                self._cache[key] = value
+        return value
+
+    def value(self, attr):
+        raw = self.raw(attr)
+        if ":" in str(raw):
+            try:
+                return getattr(raw, attr.val)
+            except AttributeError:
+                return raw()
+        else:
+            return raw
+
+    def set_value(self, attr, *args, **kwargs):
+        return None
+
+    def create_attr(self, attr, *args, **kwargs):
+        return None
+
+    def lock(self, attr, on=True):
+        return None
+
+    def hide_attr(self, attr, on=True):
+        return None
+
+    # bulk
+    def get_attrs(self, obj, names=None):
+        """
+        values of attributes in one dict.
+        hosts override this to read everything in a single pass.
+
+        Args:
+            obj: Node
+            names: attribute names, all attributes when None
+
+        Returns: dict
+        """
+        if names is None:
+            names = self.attrs(obj) or ()
+
+        values = {}
+        for name in names:
+            try:
+                values[name] = self.attr(obj, name).value
+            except Exception:
+                continue
+        return values
+
+    def sample(self, obj, names, frames):
+        """
+        values of attributes across frames
+
+        Args:
+            obj: Node
+            names: attribute names
+            frames: frame numbers
+
+        Returns: [[channel, ...] per frame], vectors are flattened
+        """
+        raise YException("sample is not supported on %s" % self)
+
+    def get_keys(self, obj, name):
+        """
+        animation curve of one channel
+
+        Args:
+            obj: Node
+            name: attribute name, blender takes "location[1]" for array index
+
+        Returns: (times, values, in slopes, out slopes), slopes are value per frame
+        """
+        raise YException("keyframe is not supported on %s" % self)
+
+    def set_keys(self, obj, name, times, values, in_slopes=None, out_slopes=None):
+        """
+        replace animation curve of one channel.
+        values are in ui units, tangents of a side are left to the host when its slopes are None.
+        the caller opens the undo step, maya returns the dg modifier and curve change which undo it.
+        """
+        raise YException("keyframe is not supported on %s" % self)
+
+    def get_geometry(self, obj):
+        """
+        mesh buffers of obj as numpy arrays
+
+        Returns: {
+            "points": (points, 3) float32 in object space,
+            "normals": (points, 3) float32, empty when the mesh has none,
+            "uvs": (uvs, 2) float32 in host layout, per face vertex or per uv id on maya,
+            "counts": vertices per face int32,
+            "indices": point index of each face vertex int32,
+        }
+        raises YGeometryException when obj has no mesh
+        """
+        raise YException("geometry is not supported on %s" % self)
+
+    def set_geometry(self, obj, points=None, normals=None, uvs=None):
+        """
+        write buffers back, topology must be unchanged.
+        the caller opens the undo step.
+        """
+        raise YException("geometry is not supported on %s" % self)
+
+    def set_attrs(self, obj, values):
+        """
+        write attributes of one node.
+        the caller opens the undo step, hosts override this with the cheapest native form.
+
+        Args:
+            obj: Node
+            values: {name: value}
+
+        Returns: None
+        """
+        for name, value in values.items():
+            self.set_value(self.attr(obj, name), value)
+
+    def get_column(self, nodes, val):
+        """
+        values of one attribute across nodes
+
+        Args:
+            nodes: NodeArray
+            val: attribute name
+
+        Returns: list
+        """
+        return [self.attr(node, val).value for node in nodes]
+
+    def set_column(self, nodes, val, values):
+        """
+        write one attribute across nodes.
+        the caller opens the undo step.
+
+        Args:
+            nodes: NodeArray
+            val: attribute name
+            values: sequence of the same length as nodes
+
+        Returns: None, maya returns the dg modifier which undoes it
+        """
+        for node, value in zip(nodes, values):
+            self.set_attrs(node, {val: value})
+
+    # File
+    def basename(self, path):
+        return os.path.basename(path)
+
+    def open(self, cls, *args, **kwargs):
+        return None
+
+    def save(self, cls, *args, **kwargs):
+        return None
+
+    def current(self, f):
+        return None
+
+
+@register("SDNode")
+class SubstanceDesigner(Backend):
+    """Substance Designer"""
+
+    def setup(self, obj):
+        if obj.item:
+            obj._inputs = meta.graph.getNodeFromId(obj.name).getProperties(meta.sd.SDPropertyCategory.Input)
+            obj._outputs = meta.graph.getNodeFromId(obj.name).getProperties(meta.sd.SDPropertyCategory.Output)
+
+    def repr(self, obj):
+        return "id:" + obj.name
+
+    def name(self, obj):
+        return obj.id
+
+    def id(self, obj):
+        node_id = ""
+        for node in meta.graph.getNodes():
+            d = node.getDefinition()
+            if (d.getId() == obj.item or d.getLabel() == obj.item or node.getIdentifier() == obj.item):
+                node_id = node.getIdentifier()
+                break
+        return node_id if node_id else meta.graph.getIdentifier()
+
+    def rename(self, obj, *args, **kwargs):
+        meta.graph.setIdentifier(args[0])
+        return self.Node(args[0])
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        node = meta.graph.getNodeFromId(attr.obj)
+        prop = node.getPropertyFromId(attr.val, meta.sd.SDPropertyCategory.Input)
+        return node.getPropertyValue(prop).get()
+
+    def watch(self, emit):
+        application = meta.sd.getContext().getSDApplication()
+        ids = [
+            application.registerAfterFileLoadedCallback(lambda path: emit(event.OPENED, path)),
+            application.registerAfterFileSavedCallback(lambda path, succeed: emit(event.SAVED, path)),
+        ]
+        self.hook(lambda: [application.unregisterCallback(i) for i in ids])
+        return True
+
+    def node_type(self, obj):
+        return meta.graph.getNodeFromId(obj.name).getDefinition().getId()
+
+    def exists(self, obj, val):
+        node = meta.graph.getNodeFromId(obj.name)
+        return node.getPropertyFromId(val, meta.sd.SDPropertyCategory.Input) is not None
+
+    def describe(self, obj):
+        schema = {}
+        node = meta.graph.getNodeFromId(obj.name)
+        for prop in node.getProperties(meta.sd.SDPropertyCategory.Input):
+            kind = prop.getType().getId().lower()
+            size = int(kind[-1]) if kind[-1].isdigit() else 1
+            for name, cls in ("bool", bool), ("int", int), ("float", float), ("string", str):
+                if kind.startswith(name):
+                    break
+            else:
+                cls = None
+            default = prop.getDefaultValue()
+            schema[prop.getId()] = Field(
+                prop.getId(), cls, default.get() if default else None, size
+            )
+        return schema
+
+    def attrs(self, obj, *args, **kwargs):
+        return (
+            prop.getId() for prop in
+            meta.graph.getNodeFromId(obj.name).getProperties(
+                meta.sd.SDPropertyCategory.Input
+            )
+        )
+
+    def create(self, obj, *args, **kwargs):
+        node_id = (
+            args[0] if "::" in args[0] else "::".join(["sbs", "compositing", args[0]])
+        )
+        return self.Node(meta.graph.newNode(node_id).getIdentifier())
+
+    def delete(self, obj, *args, **kwargs):
+        return meta.graph.deleteNode(meta.graph.getNodeFromId(obj.name))
+
+    def instance(self, obj, *args, **kwargs):
+        return meta.graph.newInstanceNode(obj.name, *args, **kwargs)
+
+    def select(self, obj, *args, **kwargs):
+        return self._sel()
+
+    def parent(self, obj, *args, **kwargs):
+        nodes = []
+        for prop in obj._inputs:
+            for connect in meta.graph.getNodeFromId(
+                    obj.name
+            ).getPropertyConnections(prop):
+                nodes.append(self.Node(connect.getInputPropertyNode().getIdentifier()))
+        return nodes
+
+    def children(self, obj, *args, **kwargs):
+        nodes = []
+        for prop in obj._outputs:
+            for connect in meta.graph.getNodeFromId(
+                    obj.name
+            ).getPropertyConnections(prop):
+                nodes.append(self.Node(connect.getOutputPropertyNode().getIdentifier()))
+        return nodes
+
+    def connect(self, obj, *args, **kwargs):
+        args = (args[0], meta.graph.getNodeFromId(args[1].id), args[2])
+        return (
+            meta.graph.getNodeFromId(obj.name)
+                .newPropertyConnectionFromId(*args)
+                .getClassName()
+        )
+
+    def disconnect(self, obj, *args, **kwargs):
+        for arg in args:
+            for prop in obj._inputs:
+                if arg == prop.getId():
+                    return meta.graph.getNodeFromId(
+                        obj.name
+                    ).deletePropertyConnections(prop)
+            for prop in obj._outputs:
+                if arg == prop.getId():
+                    return meta.graph.getNodeFromId(
+                        obj.name
+                    ).deletePropertyConnections(prop)
+        return
+
+    def inputs(self, obj, *args, **kwargs):
+        return [
+            connect.getId() for connect in obj._inputs if connect.isConnectable()
+        ]
+
+    def outputs(self, obj, *args, **kwargs):
+        return [
+            connect.getId() for connect in obj._outputs if connect.isConnectable()
+        ]
+
+    def connect_many(self, links):
+        for src, output, dst, input in links:
+            meta.graph.getNodeFromId(src.name).newPropertyConnectionFromId(
+                output, meta.graph.getNodeFromId(dst.name), input
+            )
+
+    def connections(self, obj):
+        names = []
+        edges = []
+        for node in meta.graph.getNodes():
+            name = node.getIdentifier()
+            names.append(name)
+            for prop in node.getProperties(meta.sd.SDPropertyCategory.Input):
+                for connect in node.getPropertyConnections(prop):
+                    edges.append((connect.getInputPropertyNode().getIdentifier(), name))
+        return names, edges
+
+    def value(self, attr):
+        return self.raw(attr)
+
+    def set_value(self, attr, *args, **kwargs):
+        field = self.field(attr)
+        kind = field.type if field else type(attr.value)
+        size = field.size if field else 1
+
+        if kind == bool:
+            sd_value = meta.SDValueBool.sNew(bool(args[0]))
+        elif kind == float and size > 1:
+            value = getattr(meta, "float%d" % size)(*args[0])
+            sd_value = getattr(meta, "SDValueFloat%d" % size).sNew(value)
+        elif kind == float:
+            sd_value = meta.SDValueFloat.sNew(float(args[0]))
+        elif kind == str:
+            sd_value = meta.SDValueString.sNew(str(args[0]))
+        else:
+            sd_value = meta.SDValueInt.sNew(int(args[0]))
+
+        prop = meta.graph.getNodeFromId(attr.obj).getPropertyFromId(
+            attr.val, meta.sd.SDPropertyCategory.Input
+        )
+        return meta.graph.getNodeFromId(attr.obj).setPropertyValue(prop, sd_value)
+
+    def open(self, cls, *args, **kwargs):
+        return cls(meta.manager.loadUserPackage(*args, **kwargs))
+
+    def save(self, cls, *args, **kwargs):
+        return cls(meta.manager.savePackageAs(*args, **kwargs))
+
+    def current(self, f):
+        return meta.manager.getUserPackageFromFilePath()
+
+
+@register("getAttr")
+class Maya(Backend):
+    """Maya"""
+    scene_events = True
+
+    def identity(self, item):
+        uuid = meta.ls(item, uuid=1)
+        return uuid[0] if uuid else None
+
+    def identities(self, names):
+        if not names:
+            return {}
+        uuids = meta.ls(names, uuid=1) or []
+        # ls drops missing and repeated names, order is only kept when nothing is dropped
+        return dict(zip(names, uuids)) if len(uuids) == len(names) else {}
+
+    def id(self, obj):
+        return meta.ls(obj.name, uuid=1)[0] or 0
+
+    def rename(self, obj, *args, **kwargs):
+        return meta.rename(obj.item, *args, **kwargs)
+
+    def attr(self, obj, val, *args, **kwargs):
+        if args or kwargs:
+            return self._attribute(
+                meta.getAttr(obj.name + "." + val, *args, **kwargs), obj, val)
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        return meta.getAttr(attr.obj + "." + attr.val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return tuple(meta.listAttr(obj.name, *args, **kwargs) or [])
+
+    def node_type(self, obj):
+        return meta.nodeType(obj.name)
+
+    def exists(self, obj, val):
+        return meta.attributeQuery(val, node=obj.name, exists=True)
+
+    def describe(self, obj):
+        import maya.api.OpenMaya as om
+
+        schema = {}
+        for attr in om.MNodeClass(self.node_type(obj)).getAttributes():
+            fn = om.MFnAttribute(attr)
+            kind, default, size = None, None, 1
+            if attr.hasFn(om.MFn.kCompoundAttribute):
+                size = om.MFnCompoundAttribute(attr).numChildren()
+            elif attr.hasFn(om.MFn.kNumericAttribute):
+                num = om.MFnNumericAttribute(attr)
+                kind = {
+                    om.MFnNumericData.kBoolean: bool,
+                    om.MFnNumericData.kFloat: float,
+                    om.MFnNumericData.kDouble: float,
+                }.get(num.numericType(), int)
+                default = num.default
+            elif attr.hasFn(om.MFn.kUnitAttribute):
+                kind = float
+            elif attr.hasFn(om.MFn.kEnumAttribute):
+                kind = int
+                default = om.MFnEnumAttribute(attr).default
+            elif attr.hasFn(om.MFn.kTypedAttribute):
+                if om.MFnTypedAttribute(attr).attrType() == om.MFnData.kString:
+                    kind = str
+            for name in fn.name, fn.shortName:
+                schema[name] = Field(fn.name, kind, default, size)
+        return schema
+
+    def create(self, obj, *args, **kwargs):
+        return self.Node(meta.createNode(*args, **kwargs))
+
+    def create_many(self, specs):
+        nodes = []
+        for kind, name, parent, attrs in specs:
+            flags = {"skipSelect": True}
+            if name:
+                flags["name"] = name
+            if parent:
+                flags["parent"] = _name(parent)
+            node = self.Node(meta.createNode(kind, **flags))
+            if attrs:
+                self.set_attrs(node, attrs)
+            nodes.append(node)
+        return nodes
+
+    def delete_many(self, nodes):
+        # ls with an empty list returns every node in the scene
+        if not nodes:
+            return {}
+        names = meta.ls([node.name for node in nodes], long=True) or []
+        names.sort(key=lambda name: name.count("|"), reverse=True)
+
+        failures = {}
+        if len(names) < len(nodes):
+            for node in nodes:
+                if not meta.objExists(node.name):
+                    failures[node.name] = YException("%s is not found" % node.name)
+
+        if not names:
+            return failures
+
+        try:
+            meta.delete(names)
+        except RuntimeError:
+            for name in names:
+                try:
+                    meta.delete(name)
+                except RuntimeError as e:
+                    failures[name] = e
+        return failures
+
+    def delete(self, obj, *args, **kwargs):
+        return meta.delete(obj.name, *args, **kwargs)
+
+    def instance(self, obj, *args, **kwargs):
+        if len(args) > 0:
+            return meta.instance(obj.name, lf=1)
+        else:
+            return meta.listRelatives(obj.name, ap=1, f=1)[1:] or None
+
+    @staticmethod
+    def _shapes(name):
+        """(transform, shapes) of a transform or shape path"""
+        if meta.objectType(name, isAType="shape"):
+            return meta.listRelatives(name, p=True, f=True)[0], meta.ls(name, long=True)
+        return meta.ls(name, long=True)[0], meta.listRelatives(name, s=True, ni=True, f=True) or []
+
+    def replace_with_instance(self, master, target):
+        # only the shape is instanced, the target transform and its children stay
+        _, shapes = self._shapes(master.name)
+        transform, olds = self._shapes(target.name)
+        if not shapes:
+            raise YException("%s has no shape" % master.name)
+
+        for shape in shapes:
+            meta.parent(shape, transform, add=True, shape=True)
+        if olds:
+            meta.delete(olds)
+        self.release(target)
+        return self.Node(transform)
+
+    def select(self, obj, *args, **kwargs):
+        if "shape" not in kwargs and "s" not in kwargs:
+            kwargs["s"] = True
+
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return meta.select(*args, **kwargs)
+
+    def parent(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) > 0:
+            return meta.parent(obj.item, *args, **kwargs)
+        else:
+            return self.Node(
+                partial(meta.listRelatives, obj.item, p=1)(*args, **kwargs)
+            )
+
+    def children(self, obj, *args, **kwargs):
+        return partial(meta.listRelatives, obj.item, c=1)(*args, **kwargs) or None
+
+    def hierarchy(self, obj):
+        paths = meta.listRelatives(obj.name, ad=True, f=True) or []
+        return [(path, path.rsplit("|", 1)[0]) for path in reversed(paths)]
+
+    def scene(self, obj=None):
+        if obj is None:
+            items = meta.ls(dag=True, long=True, showType=True) or []
+        else:
+            paths = meta.listRelatives(obj.name, ad=True, f=True) or []
+            items = meta.ls(paths, long=True, showType=True) if paths else []
+        return [
+            (name, name.rsplit("|", 1)[0], kind)
+            for name, kind in zip(items[::2], items[1::2])
+        ]
+
+    def _keep(self, ids):
+        import maya.api.OpenMaya as om
+
+        def remove():
+            for i in ids:
+                try:
+                    om.MMessage.removeCallback(i)
+                except RuntimeError:
+                    # callbacks of deleted nodes are gone with them
+                    pass
+
+        self.hook(remove)
+
+    def watch_selection(self):
+        import maya.api.OpenMaya as om
+        self._keep([om.MEventMessage.addEventCallback("SelectionChanged", self.selection_changed)])
+        return True
+
+    def watch(self, emit):
+        import maya.api.OpenMaya as om
+
+        ids = []
+        message = om.MNodeMessage
+
+        def path(node):
+            if node.hasFn(om.MFn.kDagNode):
+                return om.MFnDagNode(node).fullPathName()
+            return om.MFnDependencyNode(node).name()
+
+        def renamed(node, previous, data):
+            name = path(node)
+            emit(event.RENAMED, name)
+            if previous:
+                emit(event.RENAMED, name.rsplit("|", 1)[0] + "|" + previous if "|" in name else previous)
+
+        ids.append(om.MDGMessage.addNodeAddedCallback(lambda node, data: emit(event.ADDED, path(node)), "dependNode"))
+        ids.append(om.MDGMessage.addNodeRemovedCallback(lambda node, data: emit(event.REMOVED, path(node)), "dependNode"))
+        ids.append(message.addNameChangedCallback(om.MObject(), renamed))
+        for scene, kind in (
+                (om.MSceneMessage.kAfterOpen, event.OPENED),
+                (om.MSceneMessage.kAfterNew, event.OPENED),
+                (om.MSceneMessage.kAfterSave, event.SAVED),
+        ):
+            ids.append(om.MSceneMessage.addCallback(scene, lambda data, kind=kind: emit(kind)))
+        self._keep(ids)
+        return True
+
+    def watch_node(self, name, emit):
+        import maya.api.OpenMaya as om
+
+        selection = om.MSelectionList()
+        try:
+            selection.add(name)
+        except RuntimeError:
+            return None
+        message = om.MNodeMessage
+        mask = message.kAttributeSet | message.kConnectionMade | message.kConnectionBroken
+
+        def attribute_changed(msg, plug, other, data):
+            if msg & mask:
+                emit(event.CHANGED, name)
+
+        i = message.addAttributeChangedCallback(selection.getDependNode(0), attribute_changed)
+
+        def remove():
+            try:
+                om.MMessage.removeCallback(i)
+            except RuntimeError:
+                pass
+
+        return remove
+
+    def defer(self, fn, delay):
+        if super(Maya, self).defer(fn, delay):
+            return True
+        # batch has no qt, deferred calls run when maya is idle
+        import maya.utils
+        maya.utils.executeDeferred(fn)
+        return True
+
+    def find(self, kind=None, pattern=None, obj=None):
+        options = {"long": True}
+        if kind is not None:
+            options["type"] = kind
+        if obj is None:
+            return meta.ls(pattern or "*", **options) or []
+
+        paths = meta.listRelatives(obj.name, ad=True, f=True) or []
+        paths = meta.ls(paths, **options) if paths else []
+        return [path for path in paths if pattern is None or _match(path, pattern)]
+
+    def connect(self, obj, *args, **kwargs):
+        return partial(meta.connectAttr, obj.name + "." + args[0])(
+            args[1:], **kwargs
+        )
+
+    def disconnect(self, obj, *args, **kwargs):
+        return partial(meta.disconnectAttr, obj.name + "." + args[0])(
+            args[1:], **kwargs
+        )
+
+    def inputs(self, obj, *args, **kwargs):
+        return partial(meta.listConnections, s=1)(*args, **kwargs)
+
+    def outputs(self, obj, *args, **kwargs):
+        return partial(meta.listConnections, d=1)(*args, **kwargs)
+
+    def connect_many(self, links):
+        for src, output, dst, input in links:
+            meta.connectAttr(src.name + "." + output, dst.name + "." + input, force=True)
+
+    def connections(self, obj):
+        names = meta.listHistory(obj.name) or []
+        plugs = meta.listConnections(names, s=True, d=False, c=True, p=True) or []
+        members = set(names)
+        edges = []
+        for dst, src in zip(plugs[::2], plugs[1::2]):
+            src, dst = src.split(".", 1)[0], dst.split(".", 1)[0]
+            if src in members:
+                edges.append((src, dst))
+        return names, edges
+
+    def set_value(self, attr, *args, **kwargs):
+        return meta.setAttr(attr.obj + "." + attr.val, *args, **kwargs)
+
+    def create_attr(self, attr, *args, **kwargs):
+        return meta.addAttr(attr.obj, ln='ID', k=True)
+
+    def lock(self, attr, on=True):
+        return meta.setAttr(attr.obj + "." + attr.val, lock=on)
+
+    def hide_attr(self, attr, on=True):
+        return meta.setAttr(attr.obj + "." + attr.val, keyable=not on, channelBox=not on)
+
+    @staticmethod
+    def _plug_value(om, plug):
+        attr = plug.attribute()
+        if plug.isArray or plug.isCompound:
+            return meta.getAttr(plug.name())
+
+        if attr.hasFn(om.MFn.kNumericAttribute):
+            kind = om.MFnNumericAttribute(attr).numericType()
+            if kind == om.MFnNumericData.kBoolean:
+                return plug.asBool()
+            if kind in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble, om.MFnNumericData.kAddr):
+                return plug.asDouble()
+            return plug.asInt()
+
+        if attr.hasFn(om.MFn.kUnitAttribute):
+            kind = om.MFnUnitAttribute(attr).unitType()
+            if kind == om.MFnUnitAttribute.kAngle:
+                return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+            if kind == om.MFnUnitAttribute.kDistance:
+                return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+            if kind == om.MFnUnitAttribute.kTime:
+                return plug.asMTime().asUnits(om.MTime.uiUnit())
+            return plug.asDouble()
+
+        if attr.hasFn(om.MFn.kEnumAttribute):
+            return plug.asShort()
+
+        if attr.hasFn(om.MFn.kTypedAttribute):
+            if om.MFnTypedAttribute(attr).attrType() == om.MFnData.kString:
+                return plug.asString()
+
+        return meta.getAttr(plug.name())
+
+    def get_attrs(self, obj, names=None):
+        import maya.api.OpenMaya as om
+
+        sel = om.MSelectionList()
+        sel.add(obj.name)
+        fn = om.MFnDependencyNode(sel.getDependNode(0))
+        if names is None:
+            attrs = (fn.attribute(i) for i in range(fn.attributeCount()))
+            plugs = (fn.findPlug(a, False) for a in attrs)
+            plugs = ((p.partialName(useLongNames=True), p) for p in plugs if not p.isChild and not p.isElement)
+        else:
+            # keyed by the requested name, "tx" stays "tx"
+            plugs = ((name, fn.findPlug(name, False)) for name in names if fn.hasAttribute(name))
+
+        values = {}
+        for name, plug in plugs:
+            try:
+                values[name] = self._plug_value(om, plug)
+            except RuntimeError:
+                continue
+        return values
+
+    @staticmethod
+    def _set(path, value):
+        if isinstance(value, str):
+            meta.setAttr(path, value, type="string")
+        elif isinstance(value, (list, tuple)):
+            meta.setAttr(path, *value)
+        else:
+            meta.setAttr(path, value)
+
+    @staticmethod
+    def _fps():
+        return meta.eval("currentTimeUnitToFPS()")
+
+    def get_keys(self, obj, name):
+        plug = obj.name + "." + name
+        fps = self._fps()
+
+        def slope(angles):
+            return [math.tan(math.radians(a)) / fps for a in angles or ()]
+
+        return (
+            meta.keyframe(plug, q=True, timeChange=True) or [],
+            meta.keyframe(plug, q=True, valueChange=True) or [],
+            slope(meta.keyTangent(plug, q=True, inAngle=True)),
+            slope(meta.keyTangent(plug, q=True, outAngle=True)),
+        )
+
+    def set_keys(self, obj, name, times, values, in_slopes=None, out_slopes=None):
+        import maya.api.OpenMaya as om
+        import maya.api.OpenMayaAnim as oma
+
+        # every edit goes through the modifier and the curve change, undone together
+        modifier = om.MDGModifier()
+        change = oma.MAnimCurveChange()
+        sel = om.MSelectionList()
+        sel.add(obj.name + "." + name)
+        plug = sel.getPlug(0)
+        old = oma.MAnimUtil.findAnimation(plug)
+        for index in range(len(old)):
+            modifier.deleteNode(old[index])
+        modifier.doIt()
+
+        curve = oma.MFnAnimCurve()
+        curve.create(plug, oma.MFnAnimCurve.kAnimCurveUnknown, modifier)
+        modifier.doIt()
+
+        # addKeys takes internal units, values come in ui units like keyframe -q
+        kind = curve.animCurveType
+        if kind == oma.MFnAnimCurve.kAnimCurveTA:
+            unit = om.MAngle.uiUnit()
+            values = [om.MAngle(v, unit).asRadians() for v in values]
+        elif kind == oma.MFnAnimCurve.kAnimCurveTL:
+            unit = om.MDistance.uiUnit()
+            values = [om.MDistance(v, unit).asCentimeters() for v in values]
+
+        fixed, auto = oma.MFnAnimCurve.kTangentFixed, oma.MFnAnimCurve.kTangentAuto
+        unit = om.MTime.uiUnit()
+        curve.addKeys(
+            om.MTimeArray([om.MTime(t, unit) for t in times]), om.MDoubleArray(values),
+            auto if in_slopes is None else fixed, auto if out_slopes is None else fixed,
+            False, change
+        )
+
+        # angles in the same units as keyTangent -q of get_keys
+        fps = self._fps()
+        for is_in, slopes in (True, in_slopes), (False, out_slopes):
+            for index, slope in enumerate(slopes or ()):
+                curve.setTangentsLocked(index, False, change)
+                weight = curve.getTangentAngleWeight(index, is_in)[1]
+                curve.setTangent(index, om.MAngle(math.atan(slope * fps)), weight, is_in, change)
+        return modifier, change
+
+    @staticmethod
+    def _mesh(obj):
+        import maya.api.OpenMaya as om
+
+        sel = om.MSelectionList()
+        sel.add(obj.name)
+        path = sel.getDagPath(0)
+        if not path.hasFn(om.MFn.kMesh):
+            try:
+                path.extendToShape()
+            except RuntimeError:
+                raise YGeometryException(obj.name)
+            if not path.hasFn(om.MFn.kMesh):
+                raise YGeometryException(obj.name)
+        return om.MFnMesh(path)
+
+    def get_geometry(self, obj):
+        import maya.api.OpenMaya as om
+
+        np = _numpy()
+        fn = self._mesh(obj)
+        counts, indices = fn.getVertices()
+        u, v = fn.getUVs()
+        return {
+            "points": np.array(fn.getPoints(om.MSpace.kObject), np.float32)[:, :3],
+            "normals": np.array(fn.getVertexNormals(False, om.MSpace.kObject), np.float32).reshape(-1, 3),
+            "uvs": np.column_stack([np.array(u, np.float32), np.array(v, np.float32)]),
+            "counts": np.array(counts, np.int32),
+            "indices": np.array(indices, np.int32),
+        }
+
+    def set_geometry(self, obj, points=None, normals=None, uvs=None):
+        import maya.api.OpenMaya as om
+
+        fn = self._mesh(obj)
+        if points is not None:
+            fn.setPoints(om.MPointArray(points.tolist()), om.MSpace.kObject)
+        if normals is not None:
+            fn.setVertexNormals(om.MVectorArray(normals.tolist()), om.MIntArray(range(len(normals))))
+        if uvs is not None:
+            fn.setUVs(uvs[:, 0].tolist(), uvs[:, 1].tolist())
+
+    def sample(self, obj, names, frames):
+        plugs = [obj.name + "." + name for name in names]
+        return [_flat([meta.getAttr(plug, time=frame) for plug in plugs]) for frame in frames]
+
+    def set_attrs(self, obj, values):
+        for name, value in values.items():
+            self._set(obj.name + "." + name, value)
+
+    def get_column(self, nodes, val):
+        import maya.api.OpenMaya as om
+
+        # a selection list merges repeated plugs, so values are kept by path
+        paths = [node.name + "." + val for node in nodes]
+        sel = om.MSelectionList()
+        values = {}
+        for path in paths:
+            if path not in values:
+                sel.clear()
+                sel.add(path)
+                values[path] = self._plug_value(om, sel.getPlug(0))
+        return [values[path] for path in paths]
+
+    @staticmethod
+    def _new_value(om, modifier, plug, value):
+        """queue value in ui units like _set"""
+        attr = plug.attribute()
+        if plug.isArray or plug.isCompound or isinstance(value, (list, tuple)):
+            values = value if isinstance(value, (list, tuple)) else [value]
+            modifier.commandToExecute("setAttr %s %s" % (
+                plug.name(), " ".join(str(int(v)) if isinstance(v, bool) else repr(v) for v in values)
+            ))
+        elif attr.hasFn(om.MFn.kNumericAttribute):
+            kind = om.MFnNumericAttribute(attr).numericType()
+            if kind == om.MFnNumericData.kBoolean:
+                modifier.newPlugValueBool(plug, bool(value))
+            elif kind in (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble, om.MFnNumericData.kAddr):
+                modifier.newPlugValueDouble(plug, value)
+            else:
+                modifier.newPlugValueInt(plug, int(value))
+        elif attr.hasFn(om.MFn.kUnitAttribute):
+            kind = om.MFnUnitAttribute(attr).unitType()
+            if kind == om.MFnUnitAttribute.kAngle:
+                modifier.newPlugValueMAngle(plug, om.MAngle(value, om.MAngle.uiUnit()))
+            elif kind == om.MFnUnitAttribute.kDistance:
+                modifier.newPlugValueMDistance(plug, om.MDistance(value, om.MDistance.uiUnit()))
+            elif kind == om.MFnUnitAttribute.kTime:
+                modifier.newPlugValueMTime(plug, om.MTime(value, om.MTime.uiUnit()))
+            else:
+                modifier.newPlugValueDouble(plug, value)
+        elif attr.hasFn(om.MFn.kEnumAttribute):
+            modifier.newPlugValueShort(plug, int(value))
+        else:
+            modifier.newPlugValueString(plug, str(value))
+
+    def set_column(self, nodes, val, values):
+        import maya.api.OpenMaya as om
+
+        # one modifier for the whole column, returned to undo it
+        modifier = om.MDGModifier()
+        sel = om.MSelectionList()
+        for node, value in zip(nodes, values):
+            sel.clear()
+            sel.add(node.name + "." + val)
+            self._new_value(om, modifier, sel.getPlug(0), value)
+        modifier.doIt()
+        return modifier
+
+    def open(self, cls, *args, **kwargs):
+        return cls(partial(meta.file, i=1)(*args, **kwargs))
+
+    def save(self, cls, *args, **kwargs):
+        return cls(partial(meta.file, s=1)(*args, **kwargs))
+
+    def current(self, f):
+        return meta.file(exn=1, q=1)
+
+
+@register("hda")
+class Houdini(Backend):
+    """Houdini"""
+    scene_events = True
+
+    def _node(self, native):
+        node = self.nodes([native.path()], [native.sessionId()])[0]
+        node._handle = native
+        return node
+
+    def identities(self, names):
+        return dict(
+            (name, native.sessionId()) for name, native in zip(names, meta.nodes(names)) if native
+        )
+
+    def identity(self, item):
+        node = item if hasattr(item, "path") else meta.node(item)
+        return node.sessionId() if node else None
+
+    def lookup(self, name):
+        return meta.node(name)
+
+    def alive(self, obj, handle):
+        try:
+            return bool(handle.sessionId())
+        except Exception:
+            return False
+
+    def setup(self, obj):
+        if hasattr(obj.item, "path"):
+            obj._handle = obj.item
+
+    def name(self, obj):
+        path = getattr(obj.item, "path", None)
+        return path() if path else obj.item
+
+    def id(self, obj):
+        return self.handle(obj).sessionId() or 0
+
+    def rename(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        result = node.setName(*args, **kwargs)
+        obj.item = node.path()
+        return result
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        node = self.owner(attr)
+        parm = node.parm(attr.val) or node.parmTuple(attr.val)
+        return parm.eval()
+
+    def attrs(self, obj, *args, **kwargs):
+        return (p.name() for p in self.handle(obj).parms() or [])
+
+    def node_type(self, obj):
+        return self.handle(obj).type().nameWithCategory()
+
+    def exists(self, obj, val):
+        node = self.handle(obj)
+        return node.parm(val) is not None or node.parmTuple(val) is not None
+
+    def describe(self, obj):
+        kinds = {
+            meta.parmTemplateType.Int: int,
+            meta.parmTemplateType.Float: float,
+            meta.parmTemplateType.String: str,
+            meta.parmTemplateType.Toggle: bool,
+            meta.parmTemplateType.Menu: int,
+        }
+        schema = {}
+        # templates of the node type, spare parms and multiparm instances are left to exists
+        for template in self.handle(obj).type().parmTemplateGroup().entriesWithoutFolders():
+            name = template.name()
+            if "#" in name:
+                continue
+            kind = kinds.get(template.type())
+            size = template.numComponents()
+            try:
+                defaults = template.defaultValue()
+            except AttributeError:
+                defaults = ()
+            if not isinstance(defaults, tuple):
+                defaults = defaults,
+            schema[name] = Field(name, kind, None if size > 1 else next(iter(defaults), None), size)
+            if size == 1:
+                continue
+            for index, suffix in enumerate(self._suffixes(template.namingScheme(), size)):
+                default = defaults[index] if index < len(defaults) else None
+                schema[name + suffix] = Field(name + suffix, kind, default, 1)
+        return schema
+
+    @staticmethod
+    def _suffixes(scheme, size):
+        """component suffixes of parm tuple from hou.parmNamingScheme"""
+        suffixes = {
+            "XYZW": "xyzw", "XYWH": "xywh", "UVW": "uvw", "RGBA": "rgba",
+            "MinMax": ("min", "max"), "MaxMin": ("max", "min"),
+            "StartEnd": ("start", "end"), "BeginEnd": ("begin", "end"),
+        }.get(scheme.name())
+        if suffixes is None:
+            return [str(i + 1) for i in range(size)]
+        return list(suffixes)[:size]
+
+    def create(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._node(
+                partial(self.handle(obj).createNode, obj.name)(*args, **kwargs)
+            )
+        return self._node(self.handle(obj).createNode(*args, **kwargs))
+
+    def create_many(self, specs):
+        nodes = []
+        parents = {}
+        for kind, name, parent, attrs in specs:
+            parent = _name(parent) or "/obj"
+            if parent not in parents:
+                parents[parent] = meta.node(parent)
+            native = parents[parent].createNode(kind, name)
+            if attrs:
+                native.setParms(attrs)
+            nodes.append(self._node(native))
+        return nodes
+
+    def depth(self, obj):
+        return obj.name.count("/")
+
+    def delete_many(self, nodes):
+        failures = {}
+        groups = {}
+        for node in nodes:
+            native = self.handle(node)
+            if native is None:
+                failures[node.name] = YException("%s is not found" % node.name)
+                continue
+            groups.setdefault(native.parent().path(), []).append(native)
+            self.release(node)
+
+        for parent in sorted(groups, key=lambda path: path.count("/"), reverse=True):
+            try:
+                meta.node(parent).deleteItems(groups[parent])
+            except meta.Error:
+                for native in groups[parent]:
+                    try:
+                        native.destroy()
+                    except meta.Error as e:
+                        failures[native.path()] = e
+        return failures
+
+    def delete(self, obj, *args, **kwargs):
+        result = self.handle(obj).destroy()
+        self.release(obj)
+        return result
+
+    def instance(self, obj, *args, **kwargs):
+        return self.handle(obj).copyTo(*args, **kwargs)
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return self.handle(obj).setCurrent(*args, **kwargs)
+
+    def parent(self, obj, *args, **kwargs):
+        return self._node(self.handle(obj).parent())
+
+    def children(self, obj, *args, **kwargs):
+        return [self._node(node) for node in self.handle(obj).children()]
+
+    def hierarchy(self, obj):
+        paths = (node.path() for node in self.handle(obj).allSubChildren())
+        return [(path, path.rsplit("/", 1)[0] or "/") for path in paths]
+
+    def scene(self, obj=None):
+        root = self.handle(obj) if obj is not None else meta.node("/")
+        rows = []
+        for node in root.allSubChildren():
+            path = node.path()
+            rows.append((path, path.rsplit("/", 1)[0] or "/", node.type().name()))
+        return rows
+
+    def watch_selection(self):
+        if not meta.isUIAvailable():
+            return False
+        changed = self.selection_changed
+        meta.ui.addSelectionCallback(changed)
+        self.hook(lambda: meta.ui.removeSelectionCallback(changed))
+        return True
+
+    def watch(self, emit):
+        types = meta.nodeEventType
+        kinds = types.ChildCreated, types.ChildDeleted, types.NameChanged
+
+        def changed(event_type, node, **kwargs):
+            if event_type == types.ChildCreated:
+                install(kwargs["child_node"])
+                emit(event.ADDED, kwargs["child_node"].path())
+            elif event_type == types.ChildDeleted:
+                emit(event.REMOVED, kwargs["child_node"].path())
+            elif event_type == types.NameChanged:
+                emit(event.RENAMED, node.path())
+
+        installed = []
+
+        def install(node):
+            node.addEventCallback(kinds, changed)
+            installed.append(node)
+
+        def remove():
+            for node in installed:
+                try:
+                    node.removeEventCallback(kinds, changed)
+                except meta.Error:
+                    pass
+            meta.hipFile.removeEventCallback(file_changed)
+
+        def install_all():
+            del installed[:]
+            root = meta.node("/")
+            for node in [root] + list(root.allSubChildren()):
+                install(node)
+
+        def file_changed(event_type):
+            if event_type in (meta.hipFileEventType.AfterLoad, meta.hipFileEventType.AfterClear):
+                install_all()
+                emit(event.OPENED)
+            elif event_type == meta.hipFileEventType.AfterSave:
+                emit(event.SAVED)
+
+        install_all()
+        meta.hipFile.addEventCallback(file_changed)
+        self.hook(remove)
+        return True
+
+    def watch_node(self, name, emit):
+        node = meta.node(name)
+        if node is None:
+            return None
+        kinds = meta.nodeEventType.ParmTupleChanged,
+
+        def changed(event_type, **kwargs):
+            emit(event.CHANGED, name)
+
+        node.addEventCallback(kinds, changed)
+
+        def remove():
+            try:
+                node.removeEventCallback(kinds, changed)
+            except meta.Error:
+                pass
+
+        return remove
+
+    def defer(self, fn, delay):
+        if not meta.isUIAvailable():
+            return False
+
+        def once():
+            meta.ui.removeEventLoopCallback(once)
+            fn()
+
+        meta.ui.addEventLoopCallback(once)
+        return True
+
+    def find(self, kind=None, pattern=None, obj=None):
+        root = self.handle(obj) if obj is not None else meta.node("/")
+        for node in root.recursiveGlob(pattern or "*"):
+            if kind is None or node.type().name() == kind:
+                yield node.path()
+
+    def connect(self, obj, *args, **kwargs):
+        return partial(self.handle(obj).setInput, 0)(*args, **kwargs)
+
+    def disconnect(self, obj, *args, **kwargs):
+        return partial(self.handle(obj).setInput, 0, None)(*args, **kwargs)
+
+    def inputs(self, obj, *args, **kwargs):
+        return [self._node(node) for node in self.handle(obj).inputs()]
+
+    def outputs(self, obj, *args, **kwargs):
+        return [self._node(node) for node in self.handle(obj).outputs()]
+
+    def connect_many(self, links):
+        for src, output, dst, input in links:
+            self.handle(dst).setInput(input or 0, self.handle(src), output or 0)
+
+    def connections(self, obj):
+        names = []
+        edges = []
+        for node in self.handle(obj).children():
+            path = node.path()
+            names.append(path)
+            edges.extend((src.path(), path) for src in node.inputs() if src is not None)
+        return names, edges
+
+    def set_value(self, attr, *args, **kwargs):
+        node = self.owner(attr)
+        parm = node.parm(attr.val) or node.parmTuple(attr.val)
+        return parm.set(
+            args[0].tolist() if hasattr(args[0], "T") else args[0], **kwargs
+        )
+
+    def create_attr(self, attr, *args, **kwargs):
+        geo = self.owner(attr).geometry()
+        map_value = "%s -> %s" % ("ID", "ID".upper())
+        if geo.findGlobalAttrib("ID") is None:
+            geo.addAttrib(meta.attribType.Global, "ID", "")
+        return geo.setGlobalAttribValue("ID", map_value)
+
+    def lock(self, attr, on=True):
+        return self.owner(attr).parm(attr.val).lock(on)
+
+    def hide_attr(self, attr, on=True):
+        return self.owner(attr).parm(attr.val).hide(on)
+
+    def get_attrs(self, obj, names=None):
+        parms = self.handle(obj).parms()
+        if names is not None:
+            names = set(names)
+            parms = (p for p in parms if p.name() in names)
+        return dict((p.name(), p.eval()) for p in parms)
+
+    def set_attrs(self, obj, values):
+        return self.handle(obj).setParms(dict(
+            (name, value.tolist() if hasattr(value, "T") else value)
+            for name, value in values.items()
+        ))
+
+    def get_keys(self, obj, name):
+        keys = self.handle(obj).parm(name).keyframes()
+        return (
+            [key.frame() for key in keys],
+            [key.value() for key in keys],
+            [key.inSlope() if key.isSlopeUsed() else 0.0 for key in keys],
+            [key.slope() if key.isSlopeUsed() else 0.0 for key in keys],
+        )
+
+    def set_keys(self, obj, name, times, values, in_slopes=None, out_slopes=None):
+        parm = self.handle(obj).parm(name)
+        keys = []
+        for index, (time, value) in enumerate(zip(times, values)):
+            key = meta.Keyframe()
+            key.setFrame(time)
+            key.setValue(value)
+            if in_slopes is not None:
+                key.setInSlope(in_slopes[index])
+            if out_slopes is not None:
+                key.setSlope(out_slopes[index])
+            key.setExpression("bezier()", meta.exprLanguage.Hscript)
+            keys.append(key)
+        parm.deleteAllKeyframes()
+        parm.setKeyframes(keys)
+
+    def _geometry(self, obj):
+        node = self.handle(obj)
+        if hasattr(node, "displayNode") and node.displayNode() is not None:
+            node = node.displayNode()
+        geo = node.geometry() if hasattr(node, "geometry") else None
+        if geo is None:
+            raise YGeometryException(obj.name)
+        return geo
+
+    def get_geometry(self, obj):
+        np = _numpy()
+        geo = self._geometry(obj)
+
+        def floats(find, read, name, width):
+            if find(name) is None:
+                return np.empty((0, width), np.float32)
+            return np.frombuffer(read(name), np.float32).reshape(-1, find(name).size())[:, :width]
+
+        # topology has no bulk getter
+        prims = geo.prims()
+        return {
+            "points": floats(geo.findPointAttrib, geo.pointFloatAttribValuesAsString, "P", 3),
+            "normals": floats(geo.findPointAttrib, geo.pointFloatAttribValuesAsString, "N", 3),
+            "uvs": floats(geo.findVertexAttrib, geo.vertexFloatAttribValuesAsString, "uv", 2),
+            "counts": np.array([prim.numVertices() for prim in prims], np.int32),
+            "indices": np.array([v.point().number() for prim in prims for v in prim.vertices()], np.int32),
+        }
+
+    def set_geometry(self, obj, points=None, normals=None, uvs=None):
+        # writable inside python sop only
+        np = _numpy()
+        geo = self._geometry(obj)
+        if points is not None:
+            geo.setPointFloatAttribValuesFromString("P", np.ascontiguousarray(points, np.float32).tobytes())
+        if normals is not None:
+            if geo.findPointAttrib("N") is None:
+                geo.addAttrib(meta.attribType.Point, "N", (0.0, 0.0, 0.0))
+            geo.setPointFloatAttribValuesFromString("N", np.ascontiguousarray(normals, np.float32).tobytes())
+        if uvs is not None:
+            width = geo.findVertexAttrib("uv").size()
+            full = np.zeros((len(uvs), width), np.float32)
+            full[:, :2] = uvs
+            geo.setVertexFloatAttribValuesFromString("uv", full.tobytes())
+
+    def sample(self, obj, names, frames):
+        node = self.handle(obj)
+        parms = [node.parm(name) or node.parmTuple(name) for name in names]
+        return [_flat([parm.evalAtFrame(frame) for parm in parms]) for frame in frames]
+
+    def get_column(self, nodes, val):
+        return [self.handle(node).parm(val).eval() for node in nodes]
+
+    @staticmethod
+    def _word(value):
+        """hscript word of a parameter value"""
+        if isinstance(value, str):
+            for char in "\\", '"', "$", "`":
+                value = value.replace(char, "\\" + char)
+            return '"%s"' % value
+        return str(int(value)) if isinstance(value, bool) else repr(value)
+
+    def set_column(self, nodes, val, values):
+        # one hscript call for the whole column
+        script = "; ".join(
+            "opparm %s %s %s" % (self.handle(node).path(), val, self._word(value))
+            for node, value in zip(nodes, values)
+        )
+        if not script:
+            return
+        out, err = meta.hscript(script)
+        if err:
+            raise YException(err)
+
+    def open(self, cls, *args, **kwargs):
+        return cls(meta.hipFile.load(*args, **kwargs))
+
+    def save(self, cls, *args, **kwargs):
+        return cls(meta.hipFile.save(*args, **kwargs))
+
+    def current(self, f):
+        return meta.hipFile.path()
+
+
+@register("runtime")
+class Max(Backend):
+    """3dsMax"""
+
+    def lookup(self, name):
+        return meta.runtime.getnodebyname(name)
+
+    def alive(self, obj, handle):
+        return meta.runtime.isValidNode(handle)
+
+    def id(self, obj):
+        return self.handle(obj).gbufferChannel or 0
+
+    def rename(self, obj, *args, **kwargs):
+        self.handle(obj).name = args[0]
+        obj.item = args[0]
+        return self.Node(args[0])
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        return getattr(self.owner(attr), attr.val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return tuple(inspect.getmembers(self.handle(obj)))
+
+    def node_type(self, obj):
+        return str(meta.runtime.classOf(self.handle(obj)))
+
+    def exists(self, obj, val):
+        return meta.runtime.isProperty(self.handle(obj), val)
+
+    def describe(self, obj):
+        node = self.handle(obj)
+        return dict(
+            (str(name), _field(str(name), meta.runtime.getProperty(node, name)))
+            for name in meta.runtime.getPropNames(node)
+        )
+
+    def create(self, obj, *args, **kwargs):
+        _cls = getattr(meta.runtime, args[0])
+        msx_class = meta.runtime.classOf(_cls)
+        _obj = _cls(**kwargs)
+
+        if str(msx_class) == "modifier":
+            node = self.handle(obj)
+            meta.runtime.addModifier(node, _obj)
+            return self.Node(node.name + "." + _obj.name)
+
+        elif str(msx_class) == "material":
+            meta.runtime.material = _obj
+
+        return self.Node(_obj.name)
+
+    def delete(self, obj, *args, **kwargs):
+        result = meta.runtime.delete(self.handle(obj))
+        self.release(obj)
+        return result
+
+    def instance(self, obj, *args, **kwargs):
+        return self.Node(meta.runtime.instance(self.handle(obj)).name)
+
+    def replace_with_instance(self, master, target):
+        native = self.handle(target)
+        name, parent, transform = native.name, native.parent, native.transform
+        node = self.handle(self.instance(master))
+        self.delete(target)
+        node.parent = parent
+        node.transform = transform
+        node.name = name
+        return self.Node(name)
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return meta.runtime.select(self.handle(obj))
+
+    def hide(self, obj, on=True):
+        return getattr(meta.runtime, "hide" if on else "unhide")(self.handle(obj))
+
+    def parent(self, obj, *args, **kwargs):
+        if len(args) > 0:
+            self.handle(obj).parent = args[0]
+            return self.Node(args[0])
+        else:
+            _parent = self.handle(obj).parent
+            return self.Node(_parent.name) if _parent else None
+
+    def children(self, obj, *args, **kwargs):
+        if len(args) > 0:
+            meta.eval("append $%s.children $%s" % (obj.item, args[0]))
+            return self.Object(args[0])
+        else:
+            nodes = []
+            children = self.handle(obj).children
+            for i in range(children.count):
+                nodes.append(children[i].name)
+            return [self.Object(node.name) for node in nodes]
+
+    def watch_selection(self):
+        callbacks, name = meta.runtime.callbacks, meta.runtime.Name
+        callbacks.addScript(name("selectionSetChanged"), self.selection_changed, id=name("yurlungur"))
+        self.hook(lambda: callbacks.removeScripts(id=name("yurlungur")))
+        return True
+
+    def get_geometry(self, obj):
+        np = _numpy()
+        node = self.handle(obj)
+        if not meta.runtime.canConvertTo(node, meta.runtime.TriMeshGeometry):
+            raise YGeometryException(obj.name)
+        mesh = node.mesh
+        # pymxs has no bulk getter, read through the object space trimesh
+        points = [meta.runtime.getVert(mesh, i + 1) for i in range(mesh.numverts)]
+        faces = [meta.runtime.getFace(mesh, i + 1) for i in range(mesh.numfaces)]
+        return {
+            "points": np.array([(p.x, p.y, p.z) for p in points], np.float32).reshape(-1, 3),
+            "normals": np.empty((0, 3), np.float32),
+            "uvs": np.empty((0, 2), np.float32),
+            "counts": np.full(len(faces), 3, np.int32),
+            "indices": np.array([int(i) - 1 for f in faces for i in (f.x, f.y, f.z)], np.int32),
+        }
+
+    def set_value(self, attr, *args, **kwargs):
+        raw = self.raw(attr)
+        if ":" in str(raw):
+            return setattr(raw, attr.val, args[0])
+        else:
+            return setattr(self.owner(attr), attr.val, args[0])
+            # http://help.autodesk.com/view/MAXDEV/2021/ENU/?guid=Max_Python_API_using_pymxs_pymxs_differences_pymxs_controllers_html
+            # return meta.runtime.setProperty(meta.runtime.getnodebyname(attr.obj), attr.val, args[0])
+
+    def set_attrs(self, obj, values):
+        node = self.handle(obj)
+        for name, value in values.items():
+            setattr(node, name, value)
+
+    def create_attr(self, attr, *args, **kwargs):
+        attributes = '''attributes "ID"
+        (
+            parameters main rollout:params
+            (
+                param1 type:#float ui:spinParam1 default:10 animateable:True
+            )
+
+            rollout params "Test Parameters"
+            (
+                spinner spinParam1 "Param1" type:#float
+            )
+        )'''
+        ca = meta.eval(attributes)
+        t = self.owner(attr)
+        meta.runtime.custAttributes.add(t.baseObject, ca)
+        partial(t, "ID").param1 = attr.val
+        return self.Attribute()
+
+    def open(self, cls, *args, **kwargs):
+        if meta.runtime.loadMaxFile(*args, **kwargs):
+            return cls(args[0])
+
+    def save(self, cls, *args, **kwargs):
+        if meta.runtime.saveMaxFile(*args, **kwargs):
+            return cls(args[0])
+
+    def current(self, f):
+        return meta.runtime.maxFilePath + meta.runtime.maxFileName
+
+
+@register("data")
+class Blender(Backend):
+    """Blender"""
+
+    def lookup(self, name):
+        return meta.data.objects[name]
+
+    def alive(self, obj, handle):
+        try:
+            return handle.name == obj.item
+        except ReferenceError:
+            return False
+
+    def id(self, obj):
+        return self.handle(obj).id_data or 0
+
+    def rename(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        node.name = "".join(args)
+        obj.item = node.name
+        return "".join(args)
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        return getattr(self.owner(attr), attr.val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return tuple(inspect.getmembers(self.handle(obj)))
+
+    def node_type(self, obj):
+        return self.handle(obj).bl_rna.identifier
+
+    def exists(self, obj, val):
+        return hasattr(self.handle(obj), val)
+
+    def describe(self, obj):
+        kinds = {"BOOLEAN": bool, "INT": int, "FLOAT": float, "STRING": str, "ENUM": str}
+        schema = {}
+        for prop in self.handle(obj).bl_rna.properties:
+            size = getattr(prop, "array_length", 0) or 1
+            default = getattr(prop, "default_array" if size > 1 else "default", None)
+            schema[prop.identifier] = Field(
+                prop.identifier, kinds.get(prop.type), default, size
+            )
+        schema.pop("rna_type", None)
+        return schema
+
+    def create(self, obj, *args, **kwargs):
+        if obj.name:
+            obj.select(obj.name)
+            return meta.ops.object.modifier_add(type=str(args[0]).upper())
+        else:
+            try:
+                return getattr(meta.ops.mesh, args[0] + "_add")(*args[1:], **kwargs)
+            except AttributeError:
+                return partial(meta.ops.object.add, type=str(args[0]).upper())(*args[1:], **kwargs)
+
+    def delete(self, obj, *args, **kwargs):
+        result = meta.context.collection.objects.unlink(self.handle(obj))
+        self.release(obj)
+        return result
+
+    def depth(self, obj):
+        depth, node = 0, self.handle(obj).parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    def instance(self, obj, *args, **kwargs):
+        return meta.ops.object.make_local(type='SELECT_OBJECT')
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            # return meta.context.view_layer.objects.selected
+            return self._sel()
+        else:
+            return meta.ops.object.select_pattern(pattern=obj.name)
+
+    def hide(self, obj, on=True):
+        return setattr(self.handle(obj), "hide_viewport", on)
+
+    def parent(self, obj, *args, **kwargs):
+        if len(args) > 0:
+            return setattr(self.handle(obj), "parent", meta.data.objects[args[0]])
+        else:
+            return self.Object(self.handle(obj).parent.name)
+
+    def children(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        return [self.Object(o.name) for o in meta.data.objects if o.parent == node]
+
+    def hierarchy(self, obj):
+        return [(o.name, o.parent.name) for o in self.handle(obj).children_recursive]
+
+    def scene(self, obj=None):
+        objects = self.handle(obj).children_recursive if obj is not None else meta.data.objects
+        return [(o.name, o.parent.name if o.parent else "", o.type) for o in objects]
+
+    def watch_selection(self):
+        # selecting objects tags the depsgraph, so every update drops the selection
+        changed = self.selection_changed
+        meta.app.handlers.depsgraph_update_post.append(changed)
+        self.hook(lambda: meta.app.handlers.depsgraph_update_post.remove(changed))
+        return True
+
+    def watch(self, emit):
+        count = [len(meta.data.objects)]
+
+        def updated(scene, depsgraph):
+            total = len(meta.data.objects)
+            if total != count[0]:
+                # depsgraph does not tell which objects are added or removed
+                emit(event.ADDED if total > count[0] else event.REMOVED)
+                count[0] = total
+            for update in depsgraph.updates:
+                if isinstance(update.id, meta.types.Object):
+                    emit(event.CHANGED, update.id.name)
+
+        def opened(*args):
+            count[0] = len(meta.data.objects)
+            emit(event.OPENED)
+
+        def saved(*args):
+            emit(event.SAVED)
+
+        handlers = meta.app.handlers
+        for handler, fn in (
+                (handlers.depsgraph_update_post, updated),
+                (handlers.load_post, opened),
+                (handlers.save_post, saved),
+        ):
+            handler.append(fn)
+            self.hook(lambda handler=handler, fn=fn: handler.remove(fn))
+        return True
+
+    def defer(self, fn, delay):
+        meta.app.timers.register(lambda: fn() and None, first_interval=delay)
+        return True
+
+    def find(self, kind=None, pattern=None, obj=None):
+        objects = self.handle(obj).children_recursive if obj is not None else meta.data.objects
+        if kind is not None:
+            kind = kind.upper()
+        for o in objects:
+            if kind is not None and o.type != kind:
+                continue
+            if pattern is None or fnmatch.fnmatchcase(o.name, pattern):
+                yield o.name
+
+    def set_value(self, attr, *args, **kwargs):
+        return setattr(
+            self.owner(attr),
+            attr.val,
+            args[0].tolist() if hasattr(args[0], "T") else args,
+        )
+
+    def create_attr(self, attr, *args, **kwargs):
+        self.owner(attr)["ID"] = str(attr.val)
+        return
+
+    def lock(self, attr, on=True):
+        return setattr(self.owner(attr), "lock_" + attr.val, on)
+
+    def get_attrs(self, obj, names=None):
+        node = self.handle(obj)
+        if names is None:
+            names = [p.identifier for p in node.bl_rna.properties if p.identifier != "rna_type"]
+        return dict((name, getattr(node, name)) for name in names if hasattr(node, name))
+
+    def set_attrs(self, obj, values):
+        node = self.handle(obj)
+        for name, value in values.items():
+            setattr(node, name, value.tolist() if hasattr(value, "T") else value)
+
+    @staticmethod
+    def _channel(name):
+        if name.endswith("]"):
+            path, index = name[:-1].rsplit("[", 1)
+            return path, int(index)
+        return name, 0
+
+    def get_keys(self, obj, name):
+        node = self.handle(obj)
+        action = node.animation_data.action if node.animation_data else None
+        curve = action.fcurves.find(*self._channel(name)) if action else None
+        if curve is None:
+            return [], [], [], []
+
+        size = len(curve.keyframe_points) * 2
+        co, left, right = [0.0] * size, [0.0] * size, [0.0] * size
+        curve.keyframe_points.foreach_get("co", co)
+        curve.keyframe_points.foreach_get("handle_left", left)
+        curve.keyframe_points.foreach_get("handle_right", right)
+
+        def slope(handle, i):
+            dx = co[i] - handle[i]
+            return (co[i + 1] - handle[i + 1]) / dx if dx else 0.0
+
+        return (
+            co[0::2], co[1::2],
+            [slope(left, i) for i in range(0, size, 2)],
+            [slope(right, i) for i in range(0, size, 2)],
+        )
+
+    def set_keys(self, obj, name, times, values, in_slopes=None, out_slopes=None):
+        node = self.handle(obj)
+        if node.animation_data is None:
+            node.animation_data_create()
+        if node.animation_data.action is None:
+            node.animation_data.action = meta.data.actions.new(node.name + "Action")
+
+        path, index = self._channel(name)
+        fcurves = node.animation_data.action.fcurves
+        curve = fcurves.find(path, index=index)
+        if curve is not None:
+            fcurves.remove(curve)
+        curve = fcurves.new(path, index=index)
+
+        points = curve.keyframe_points
+        points.add(len(times))
+        points.foreach_set("co", [v for key in zip(times, values) for v in key])
+        # handles one frame apart carry the slopes
+        if in_slopes is not None:
+            for point in points:
+                point.handle_left_type = "FREE"
+            points.foreach_set("handle_left", [
+                v for t, y, a in zip(times, values, in_slopes) for v in (t - 1.0, y - a)
+            ])
+        if out_slopes is not None:
+            for point in points:
+                point.handle_right_type = "FREE"
+            points.foreach_set("handle_right", [
+                v for t, y, b in zip(times, values, out_slopes) for v in (t + 1.0, y + b)
+            ])
+        curve.update()
+
+    def get_geometry(self, obj):
+        np = _numpy()
+        native = self.handle(obj)
+        if native.type != "MESH":
+            raise YGeometryException(obj.name)
+        mesh = native.data
+
+        def read(collection, name, dtype, width):
+            buffer = np.empty(len(collection) * width, dtype)
+            collection.foreach_get(name, buffer)
+            return buffer.reshape(-1, width) if width > 1 else buffer
+
+        layer = mesh.uv_layers.active
+        return {
+            "points": read(mesh.vertices, "co", np.float32, 3),
+            "normals": read(mesh.vertices, "normal", np.float32, 3),
+            "uvs": read(layer.data, "uv", np.float32, 2) if layer else np.empty((0, 2), np.float32),
+            "counts": read(mesh.polygons, "loop_total", np.int32, 1),
+            "indices": read(mesh.loops, "vertex_index", np.int32, 1),
+        }
+
+    def set_geometry(self, obj, points=None, normals=None, uvs=None):
+        np = _numpy()
+        mesh = self.handle(obj).data
+        if points is not None:
+            mesh.vertices.foreach_set("co", np.ascontiguousarray(points, np.float32).ravel())
+        if uvs is not None and mesh.uv_layers.active:
+            mesh.uv_layers.active.data.foreach_set("uv", np.ascontiguousarray(uvs, np.float32).ravel())
+        if normals is not None:
+            mesh.normals_split_custom_set_from_vertices(normals.tolist())
+        mesh.update()
+
+    def sample(self, obj, names, frames):
+        node = self.handle(obj)
+        action = node.animation_data.action if node.animation_data else None
+        curves = {}
+        for curve in (action.fcurves if action else ()):
+            curves[curve.data_path, curve.array_index] = curve
+
+        channels = []
+        for name in names:
+            constants = _flat(getattr(node, name))
+            for index, constant in enumerate(constants):
+                curve = curves.get((name, index))
+                channels.append(curve.evaluate if curve else (lambda frame, v=constant: v))
+        return [[channel(frame) for channel in channels] for frame in frames]
+
+    def basename(self, path):
+        return meta.path.basename(path)
+
+    def open(self, cls, *args, **kwargs):
+        return partial(meta.ops.wm.open_mainfile, filepath=args[0])(**kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        return partial(meta.ops.wm.save_mainfile, filepath=args[0])(**kwargs)
+
+    def current(self, f):
+        return meta.data.filepath
+
+
+# https://developers.maxon.net/docs/Cinema4DPythonSDK/html/modules/c4d.documents/BaseDocument/index.html?highlight=getactiveobject#BaseDocument.GetObjects
+@register("C4DAtom")
+class C4D(Backend):
+    """Cinema 4D"""
+
+    def identity(self, item):
+        node = item if hasattr(item, "GetGUID") else meta.doc.SearchObject(item)
+        return node.GetGUID() if node else None
+
+    def lookup(self, name):
+        return meta.doc.SearchObject(name)
+
+    def alive(self, obj, handle):
+        return handle.IsAlive()
+
+    def id(self, obj):
+        return self.handle(obj).GetGUID()
+
+    def rename(self, obj, *args, **kwargs):
+        result = self.handle(obj).SetName(args[0])
+        obj.item = args[0]
+        return result
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        return self.owner(attr)[getattr(meta, attr.val)]
+
+    def attrs(self, obj, *args, **kwargs):
+        attrs = []
+        ids = {}  # {v.lower(): v for v in dir(app.application) if v.isupper()}
+        for k, v in ids.items():
+            try:
+                self.handle(obj)[getattr(meta, v)]
+                attrs.append(k)
+            except AttributeError:
+                pass
+        return tuple(attrs)
+
+    def create(self, obj, *args, **kwargs):
+        if args[0][0] == "O":  # object
+            _obj = meta.BaseObject(getattr(meta, args[0]))
+            meta.doc.InsertObject(_obj)
+
+        if args[0][0] == "T":  # tag
+            _obj = self.handle(obj).MakeTag(getattr(meta, args[0]))
+
+        if args[0][0] == "M":  # material
+            _obj = meta.BaseMaterial(getattr(meta, args[0]))
+            meta.doc.InsertMaterial(_obj)
+
+        meta.EventAdd()
+        return self.Node(_obj.GetName())
+
+    def create_many(self, specs):
+        nodes = []
+        for kind, name, parent, attrs in specs:
+            _obj = meta.BaseObject(getattr(meta, kind))
+            if name:
+                _obj.SetName(name)
+            for key, value in (attrs or {}).items():
+                _obj[getattr(meta, key)] = value
+            meta.doc.InsertObject(_obj, meta.doc.SearchObject(_name(parent)) if parent else None)
+            nodes.append(self.Node(_obj.GetName()))
+
+        meta.EventAdd()
+        return nodes
+
+    def delete(self, obj, *args, **kwargs):
+        result = self.handle(obj).Remove()
+        self.release(obj)
+        return result
+
+    def instance(self, obj, *args, **kwargs):
+        _obj = meta.InstanceObject()
+        _obj.SetReferenceObject(self.handle(obj))
+        meta.doc.InsertObject(_obj)
+        return _obj.GetName()
+
+    def replace_with_instance(self, master, target):
+        native = self.handle(target)
+        _obj = meta.InstanceObject()
+        _obj.SetReferenceObject(self.handle(master))
+        _obj.SetName(native.GetName())
+        meta.doc.InsertObject(_obj, native.GetUp(), native.GetPred())
+        _obj.SetMg(native.GetMg())
+        native.Remove()
+        self.release(target)
+        meta.EventAdd()
+        return self.Node(_obj.GetName())
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            meta.doc.SetActiveObject(meta.doc.SearchObject(args[0]), meta.SELECTION_NEW)
+        return meta.doc.GetActiveObject().GetName()
+
+    def hide(self, obj, on=True):
+        return setattr(
+            self.handle(obj)[meta.ID_BASEOBJECT_VISIBILITY_EDITOR], on)
+
+    def parent(self, obj, *args, **kwargs):
+        return self.handle(obj)
+
+    def children(self, obj, *args, **kwargs):
+        return self.handle(obj)
+
+    def hierarchy(self, obj):
+        pairs = []
+        stack = [self.handle(obj)]
+        while stack:
+            parent = stack.pop()
+            child = parent.GetDown()
+            while child:
+                pairs.append((child.GetName(), parent.GetName()))
+                stack.append(child)
+                child = child.GetNext()
+        return pairs
+
+    def get_geometry(self, obj):
+        np = _numpy()
+        native = self.handle(obj)
+        if not native.CheckType(meta.Opolygon):
+            raise YGeometryException(obj.name)
+        polygons = native.GetAllPolygons()
+        faces = [(p.a, p.b, p.c) if p.IsTriangle() else (p.a, p.b, p.c, p.d) for p in polygons]
+        return {
+            "points": np.array([(p.x, p.y, p.z) for p in native.GetAllPoints()], np.float32).reshape(-1, 3),
+            "normals": np.empty((0, 3), np.float32),
+            "uvs": np.empty((0, 2), np.float32),
+            "counts": np.array([len(f) for f in faces], np.int32),
+            "indices": np.array([i for f in faces for i in f], np.int32),
+        }
+
+    def set_value(self, attr, *args, **kwargs):
+        self.owner(attr)[getattr(meta, attr.val)] = args[0]
+        return args[0]
+
+    def open(self, cls, *args, **kwargs):
+        meta.documents.LoadFile(*args)
+        return cls(args[0])
+
+    def save(self, cls, *args, **kwargs):
+        meta.documents.SaveDocument(
+            meta.doc, args[0], meta.SAVEDOCUMENTFLAGS_NONE, meta.FORMAT_C4DEXPORT
+        )
+        return cls(args[0])
+
+    def current(self, f):
+        return meta.doc.GetDocumentPath() + meta.doc.GetDocumentName()
+
+
+@register("knob")
+class Nuke(Backend):
+    """Nuke"""
+    scene_events = True
+
+    def lookup(self, name):
+        return meta.toNode(name)
+
+    def alive(self, obj, handle):
+        try:
+            return handle.fullName() == obj.item
+        except ValueError:
+            return False
+
+    def id(self, obj):
+        return self.handle(obj)["name"].value() or 0
+
+    def rename(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        result = node.setName(args[0], **kwargs)
+        obj.item = node.fullName()
+        return result
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._attribute(self.handle(obj)[val], obj, val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return (knob.name() for knob in self.handle(obj).allKnobs())
+
+    def node_type(self, obj):
+        return self.handle(obj).Class()
+
+    def exists(self, obj, val):
+        return val in self.handle(obj).knobs()
+
+    def describe(self, obj):
+        schema = {}
+        # knobs of the class come first, user knobs are added under a "User" tab
+        # and are left to exists
+        for knob in self.handle(obj).allKnobs():
+            if knob.Class() == "Tab_Knob" and knob.name() == "User":
+                break
+            value = knob.value() if hasattr(knob, "value") else None
+            size = knob.arraySize() if hasattr(knob, "arraySize") else 1
+            schema[knob.name()] = _field(knob.name(), value, size)
+        return schema
+
+    def create(self, obj, *args, **kwargs):
+        return self.Node(meta.createNode(*args, **kwargs))
+
+    def create_many(self, specs):
+        nodes = []
+        for kind, name, parent, attrs in specs:
+            knobs = dict(attrs or {})
+            if name:
+                knobs["name"] = name
+            group = meta.toNode(_name(parent)) if parent else meta.root()
+            if group is None:
+                raise YException("%s is not found" % _name(parent))
+            with group:
+                native = getattr(meta.nodes, kind)(**knobs)
+            nodes.append(self.Node(native.fullName()))
+        return nodes
+
+    def delete(self, obj, *args, **kwargs):
+        result = meta.delete(self.handle(obj), *args, **kwargs)
+        self.release(obj)
+        return result
+
+    def instance(self, obj, *args, **kwargs):
+        if len(args) > 0:
+            return meta.clone(self.handle(obj), *args, **kwargs)
+        else:
+            return self.handle(obj).clones()
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return self.handle(obj).setSelected()
+
+    def parent(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        index = node.inputs() - 1
+        return self.Node(node.input(index).name())
+
+    def connect(self, obj, *args, **kwargs):
+        return self.handle(obj).setInput(*args, **kwargs)
+
+    def disconnect(self, obj, *args, **kwargs):
+        return self.handle(obj).setInput(0, None)
+
+    def inputs(self, obj, *args, **kwargs):
+        node = self.handle(obj)
+        return [
+            self.Node(node.input(index).name())
+            for index in range(node.inputs())
+        ]
+
+    def outputs(self, obj, *args, **kwargs):
+        return self.handle(obj).dependencies(meta.EXPRESSIONS)
+
+    def connect_many(self, links):
+        for src, output, dst, input in links:
+            self.handle(dst).setInput(input or 0, self.handle(src))
+
+    def connections(self, obj):
+        nodes = meta.allNodes(group=self.handle(obj)) if obj.item else meta.allNodes()
+        names = []
+        edges = []
+        for node in nodes:
+            name = node.fullName()
+            names.append(name)
+            for index in range(node.inputs()):
+                src = node.input(index)
+                if src is not None:
+                    edges.append((src.fullName(), name))
+        return names, edges
+
+    def scene(self, obj=None):
+        if obj is not None:
+            nodes = meta.allNodes(group=self.handle(obj), recurseGroups=True)
+        else:
+            nodes = meta.allNodes(recurseGroups=True)
+        rows = []
+        for node in nodes:
+            name = node.fullName()
+            rows.append((name, name.rsplit(".", 1)[0] if "." in name else "", node.Class()))
+        return rows
+
+    def watch_selection(self):
+        def changed():
+            if meta.thisKnob().name() == "selected":
+                self.selection_changed()
+
+        meta.addKnobChanged(changed, nodeClass="*")
+        self.hook(lambda: meta.removeKnobChanged(changed, nodeClass="*"))
+        return True
+
+    def watch(self, emit):
+        def knob_changed():
+            knob = meta.thisKnob().name()
+            if knob == "name":
+                emit(event.RENAMED, meta.thisNode().fullName())
+            elif knob not in ("selected", "xpos", "ypos"):
+                emit(event.CHANGED, meta.thisNode().fullName())
+
+        for add, remove, fn, node_class in (
+                (meta.addOnCreate, meta.removeOnCreate, lambda: emit(event.ADDED, meta.thisNode().fullName()), "*"),
+                (meta.addOnDestroy, meta.removeOnDestroy, lambda: emit(event.REMOVED, meta.thisNode().fullName()), "*"),
+                (meta.addKnobChanged, meta.removeKnobChanged, knob_changed, "*"),
+                (meta.addOnScriptLoad, meta.removeOnScriptLoad, lambda: emit(event.OPENED), "Root"),
+                (meta.addOnScriptSave, meta.removeOnScriptSave, lambda: emit(event.SAVED), "Root"),
+        ):
+            add(fn, nodeClass=node_class)
+            self.hook(partial(remove, fn, nodeClass=node_class))
+        return True
+
+    def defer(self, fn, delay):
+        import threading
+        threading.Timer(delay, meta.executeInMainThread, (fn,)).start()
+        return True
+
+    def find(self, kind=None, pattern=None, obj=None):
+        options = {"recurseGroups": True}
+        if obj is not None:
+            options["group"] = self.handle(obj)
+        if kind is not None:
+            options["filter"] = kind
+        for node in meta.allNodes(**options):
+            if pattern is None or fnmatch.fnmatchcase(node.name(), pattern) \
+                    or fnmatch.fnmatchcase(node.fullName(), pattern):
+                yield node.fullName()
+
+    def set_value(self, attr, *args, **kwargs):
+        return self.owner(attr)[attr.val].setValue(
+            args[0], **kwargs
+        )
+
+    def create_attr(self, attr, *args, **kwargs):
+        if type(attr.val) == list:
+            knob = "Array_Knob"
+        if type(attr.val) == int:
+            knob = "WH_Knob"
+        if type(attr.val) == bool:
+            knob = "Boolean_Knob"
+        k = partial(meta, knob)("ID".lower(), "ID")
+        return self.owner(attr).addKnob(k)
+
+    def lock(self, attr, on=True):
+        return self.owner(attr)[attr.val].setEnabled(not on)
+
+    def hide_attr(self, attr, on=True):
+        return self.owner(attr)[attr.val].setVisible(not on)
+
+    def get_attrs(self, obj, names=None):
+        knobs = self.handle(obj).knobs()
+        if names is not None:
+            knobs = dict((name, knobs[name]) for name in names if name in knobs)
+        return dict(
+            (name, knob.value()) for name, knob in knobs.items() if hasattr(knob, "value")
+        )
+
+    def set_attrs(self, obj, values):
+        knobs = self.handle(obj).knobs()
+        for name, value in values.items():
+            knobs[name].setValue(value)
+
+    def sample(self, obj, names, frames):
+        knobs = self.handle(obj).knobs()
+        channels = []
+        for name in names:
+            knob = knobs[name]
+            size = knob.arraySize() if hasattr(knob, "arraySize") else 1
+            channels.extend(partial(knob.getValueAt, index=i) for i in range(size))
+        return [[channel(frame) for channel in channels] for frame in frames]
+
+    def open(self, cls, *args, **kwargs):
+        return meta.scriptOpen(*args, **kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        return meta.scriptSave(*args, **kwargs)
+
+    def current(self, f):
+        return meta.scriptName()
+
+
+@register("fusion")
+class Fusion(Backend):
+    """Davinci Resolve and Fusion"""
+
+    def lookup(self, name):
+        return meta.fusion.GetCurrentComp().FindTool(name)
+
+    def alive(self, obj, handle):
+        return handle.GetAttrs("TOOLS_Name") == obj.item
+
+    def id(self, obj):
+        return self.handle(obj).ID or 0
+
+    def rename(self, obj, *args, **kwargs):
+        if meta.is_fusion:
+            result = self.handle(obj).SetAttrs({"TOOLS_Name": args[0]})
+            obj.item = args[0]
+            return result
+        else:
+            return meta.davinci.Projects()[obj.item]
+
+    def attr(self, obj, val, *args, **kwargs):
+        if meta.is_fusion:
+            return self._attribute(getattr(self.handle(obj), val), obj, val)
+        else:
+            return self.Attribute
+
+    def attrs(self, obj, *args, **kwargs):
+        return tuple(self.handle(obj).GetAttrs())
+
+    def node_type(self, obj):
+        return self.handle(obj).ID
+
+    def create(self, obj, *args, **kwargs):
+        return self.Node(meta.fusion.GetCurrentComp().AddTool(*args, **kwargs).Name)
+
+    def create_many(self, specs):
+        # tools of a comp are flat, there is no container to create them in
+        for spec in specs:
+            if spec[2]:
+                raise YException("fusion has no node hierarchy, parent %s is not supported" % _name(spec[2]))
+
+        comp = meta.fusion.GetCurrentComp()
+        nodes = []
+        comp.Lock()
+        try:
+            for kind, name, parent, attrs in specs:
+                tool = comp.AddTool(kind)
+                if name:
+                    tool.SetAttrs({"TOOLS_Name": name})
+                for key, value in (attrs or {}).items():
+                    tool.SetInput(key, value)
+                nodes.append(self.Node(tool.Name))
+        finally:
+            comp.Unlock()
+        return nodes
+
+    def delete(self, obj, *args, **kwargs):
+        result = self.handle(obj).Delete()
+        self.release(obj)
+        return result
+
+    def instance(self, obj, *args, **kwargs):
+        meta.fusion.GetCurrentComp().Copy(obj.name)
+        return meta.fusion.GetCurrentComp().Paste(*args, **kwargs)
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return meta.fusion.GetCurrentComp().GetToolList(True)
+        else:
+            return meta.fusion.GetCurrentComp().CurrentFrame.FlowView.Select(
+                *args, **kwargs
+            )
+
+    def hide(self, obj, on=True):
+        return self.handle(obj).SetAttrs({"TOOLB_Visible": on, "TOOLB_Locked": True})
+
+    def parent(self, obj, *args, **kwargs):
+        return self.handle(obj).ParentTool
+
+    def connect(self, obj, *args, **kwargs):
+        return self.handle(obj).ConnectInput(*args, **kwargs)
+
+    def disconnect(self, obj, *args, **kwargs):
+        return setattr(self.handle(obj), "Input", None)
+
+    def inputs(self, obj, *args, **kwargs):
+        return self.handle(obj).GetInputList().values()[0].GetAttrs()
+
+    def outputs(self, obj, *args, **kwargs):
+        return self.handle(obj).GetOutputList().values()[0].GetAttrs()
+
+    def build(self, specs, links):
+        comp = meta.fusion.GetCurrentComp()
+        comp.Lock()
+        try:
+            return super(Fusion, self).build(specs, links)
+        finally:
+            comp.Unlock()
+
+    def connect_many(self, links):
+        comp = meta.fusion.GetCurrentComp()
+        for src, output, dst, input in links:
+            tool = comp.FindTool(src.name)
+            comp.FindTool(dst.name).ConnectInput(input or "Input", tool if output is None else getattr(tool, output))
+
+    def connections(self, obj):
+        names = []
+        edges = []
+        for tool in meta.fusion.GetCurrentComp().GetToolList(False).values():
+            names.append(tool.Name)
+            for inp in tool.GetInputList().values():
+                output = inp.GetConnectedOutput()
+                if output:
+                    edges.append((output.GetTool().Name, tool.Name))
+        return names, edges
+
+    def set_value(self, attr, *args, **kwargs):
+        return setattr(self.owner(attr), attr.val, args[0])
+
+    def open(self, cls, *args, **kwargs):
+        storage = meta.resolve.GetMediaStorage()
+        if "." in args:
+            return storage.AddItemsToMediaPool(*args)
+        else:
+            return meta.manager.LoadProject(*args, **kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        return meta.manager.SaveProject(*args, **kwargs)
+
+    def current(self, f):
+        return meta.manager.GetCurrentProject()
+
+
+@register("doc")
+class Photoshop(Backend):
+    """Photoshop"""
+
+    def rename(self, obj, *args, **kwargs):
+        try:
+            return setattr(meta.doc.activeLayer, "name", args[0])
+        except AttributeError:
+            return meta.doc.currentLayer().setValue_forKey_(args[0], "name")
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        try:
+            layer = meta.doc.layers[attr.obj]
+        except TypeError:
+            layer = meta.ps.Document().layers[attr.obj]
+
+        return getattr(layer, attr.val)
+
+    def attrs(self, obj, *args, **kwargs):
+        try:
+            return (p for p, _ in inspect.getmembers(meta.photoshop.Photoshop.ArtLayer) if "_" not in p)
+        except AttributeError:
+            return (k for k in meta.ps.Document()._doc.layers()[0].properties())
+
+    def create(self, obj, *args, **kwargs):
+        try:
+            ps = getattr(meta.photoshop.Photoshop, "ps%s" % args[0], meta.doc.psNormalLayer)
+            layer = meta.doc.artLayers.Add()
+            layer.name = obj.name
+            return setattr(layer, "Kind", ps)
+        except AttributeError:
+            _ = kwargs.update({"name": obj.name})
+            layer = meta.classForScriptingClass_("art layer").alloc().initWithProperties_(kwargs)
+            meta.ps.Document()._doc.artLayers().addObject_(layer)
+            return self.Object(obj.name)
+
+    def delete(self, obj, *args, **kwargs):
+        try:
+            return meta.doc.layers[obj.name].delete()
+        except TypeError:
+            return meta.ps.Document().layers[obj.name].delete()
+
+    def instance(self, obj, *args, **kwargs):
+        try:
+            return meta.doc.layers[obj.name].duplicate()
+        except TypeError:
+            return meta.ps.Document().layers[obj.name].duplicate()
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            try:
+                return setattr(
+                    meta.doc, "ActiveLayer", meta.doc.artLayers[obj.name],
+                )
+            except TypeError:
+                return meta.doc.currentLayer().setTo_(meta.ps.Document().layers[obj.name])
+
+    def hide(self, obj, on=True):
+        try:
+            return setattr(meta.doc.layers[obj.name], "visible", not on)
+        except TypeError:
+            return meta.ps.Document().layers[obj.name].setValue_forKey_(not on, "visible")
+
+    def parent(self, obj, *args, **kwargs):
+        return self.Node(meta.doc.artLayers[obj.name].parent.name)
+
+    def children(self, obj, *args, **kwargs):
+        return [
+            self.Object(layer.name)
+            for layer in meta.doc.LayerSets[obj.item].layers
+        ]
+
+    def set_value(self, attr, *args, **kwargs):
+        try:
+            return getattr(meta.doc.layers[attr.obj], attr.val)(*args, **kwargs)
+        except TypeError:
+            try:
+                return setattr(
+                    meta.doc.layers[attr.obj], attr.val, args[0]
+                )
+            except TypeError:
+                return meta.ps.Document().layers[attr.obj].setValue_forKey_(args[0], attr.val)
+
+    def open(self, cls, *args, **kwargs):
+        return meta.Open(*args, **kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        if args[0].endswith(".psd"):
+            return meta.doc.Save()
+        else:
+            return meta.doc.SaveAs(*args, **kwargs)
+
+    def current(self, f):
+        try:
+            return os.path.join(meta.doc.path, meta.doc.name)
+        except AttributeError:
+            path = meta.doc.filePath()
+            if path:
+                return path.absoluteString()
+            return
+
+
+@register("uclass")
+class Unreal(Backend):
+    """Unreal Engine"""
+
+    def id(self, obj):
+        return meta.ue4.uname(obj.name).get_name() or 0
+
+    def rename(self, obj, *args, **kwargs):
+        uname = meta.ue4.uname(obj.name)
+        if type(uname) == str:
+            meta.assets.rename_asset(
+                uname, os.path.join(os.path.dirname(uname), args[0])
+            )
+            return self.Node(args[0])
+        else:
+            return uname.set_actor_label(args[0])
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._plug(obj, val)
+
+    def fetch(self, attr):
+        actor = meta.ue4.uname(attr.obj)
+        try:
+            return actor.get_editor_property(attr.val)
+        except:
+            return actor.root_component.get_editor_property(attr.val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return meta.ue4.uname(obj.name).component_tags()
+
+    def create(self, obj, *args, **kwargs):
+        factory = getattr(meta, obj.name + "Factory")
+        if not args:
+            args = (obj.name, "/Game", None)
+
+        assert len(args) == 3 and factory
+
+        new_asset = partial(meta.tools.create_asset, *args)(factory(), **kwargs)
+        if new_asset:
+            meta.assets.save_loaded_asset(new_asset)
+            return self.Node(new_asset.get_name())
+        else:
+            return
+
+    def delete(self, obj, *args, **kwargs):
+        uname = meta.ue4.uname(obj.name)
+        if type(uname) == str:
+            return meta.assets.delete_asset(uname)
+        else:
+            return uname.destroy_actor()
+
+    def instance(self, obj, *args, **kwargs):
+        uname = meta.ue4.uname(obj.name)
+        if type(uname) == str:
+            return meta.assets.duplicate_asset(
+                uname, os.path.join(os.path.dirname(uname), *args)
+            )
+        else:
+            return
+
+    def select(self, obj, *args, **kwargs):
+        uname = meta.ue4.uname(obj.name)
+        if len(args) == 0 and len(kwargs) == 0:
+            if type(uname) == str:
+                return self._sel()
+            else:
+                return (
+                    self.Node(asset.get_name())
+                    for asset in meta.editor.get_selection_set()
+                )
+        else:
+            if type(uname) == str:
+                return
+            else:
+                return meta.editor.set_actor_selection_state(uname, *args)
+
+    def hide(self, obj, on=True):
+        return meta.ue4.uname(obj.name).root_component.set_editor_property(
+            "visible", not on
+        )
+
+    def parent(self, obj, *args, **kwargs):
+        return self.Node(meta.ue4.uname(obj.name).get_parent_actor().get_name())
+
+    def children(self, obj, *args, **kwargs):
+        return (
+            self.Node(actor.get_name())
+            for actor in meta.ue4.uname(obj.item).get_all_child_actors()
+        )
+
+    def set_value(self, attr, *args, **kwargs):
+        try:
+            return meta.ue4.uname(attr.obj).set_editor_property(attr.val, args[0])
+        except TypeError:
+            return getattr(meta.ue4.uname(attr.obj), attr.val)(*args, **kwargs)
+        except:
+            return meta.ue4.uname(attr.obj).root_component.set_editor_property(
+                attr.val, args[0]
+            )
+
+    def open(self, cls, *args, **kwargs):
+        return
+
+    def save(self, cls, *args, **kwargs):
+        return meta.tools.export_assets(*args, **kwargs)
+
+    def current(self, f):
+        if f.path:
+            return meta.assets.find_asset_data(f.path).package_path
+        else:
+            return meta.assets.list_assets(
+                "/Game", recursive=True, include_folder=True)
+
+
+@register("Debug")
+class Unity(Backend):
+    """Unity"""
+
+    def identity(self, item):
+        go = item if hasattr(item, "GetInstanceID") else meta.engine.GameObject.Find(item)
+        return go.GetInstanceID() if go else None
+
+    def lookup(self, name):
+        return meta.engine.GameObject.Find(name)
+
+    def alive(self, obj, handle):
+        return meta.engine.Object.op_Implicit(handle) and handle.name == obj.item
+
+    def id(self, obj):
+        return self.handle(obj).GetInstanceID() or 0
+
+    def rename(self, obj, *args, **kwargs):
+        go = self.handle(obj)
+        if go:
+            meta.editor.Undo.RegisterFullObjectHierarchyUndo(go, "Rename %s" % args[0])
+            go.name = args[0]
+            obj.item = args[0]
+        else:
+            meta.editor.AssetDatabase.RenameAsset(obj.name, args[0])
+            asset = meta.editor.AssetDatabase.LoadAssetAtPath(*args[1:])
+            meta.editor.EditorUtility.SetDirty(asset)
+
+        return self.Node(args[0])
+
+    def attr(self, obj, val, *args, **kwargs):
+        go = self.handle(obj)
+        for com in go.GetComponentsInChildren(meta.engine.Component):
+            if val in dir(go.GetComponent(com.GetType())):
+                return self._attribute(go.GetComponent(com.GetType()), obj, val)
+        return None
+
+    def attrs(self, obj, *args, **kwargs):
+        go = self.handle(obj)
+        attrs = dir(go)
+        for com in go.GetComponentsInChildren(meta.engine.Component):
+            attrs.extend(dir(go.GetComponent(com.GetType())))
+        return (set([attr for attr in attrs if not attr.startswith("__")]))
+
+    def node_type(self, obj):
+        return tuple(sorted(
+            str(com.GetType())
+            for com in self.handle(obj).GetComponentsInChildren(meta.engine.Component)
+        ))
+
+    def exists(self, obj, val):
+        go = self.handle(obj)
+        if val in dir(go):
+            return True
+        return any(
+            val in dir(go.GetComponent(com.GetType()))
+            for com in go.GetComponentsInChildren(meta.engine.Component)
+        )
+
+    def create(self, obj, *args, **kwargs):
+        go = self.handle(obj)
+        cm = getattr(meta.engine, args[0])
+
+        if go is None:
+            if issubclass(cm, meta.engine.Behaviour):
+                import clr
+                T = clr.GetClrType(cm)
+                go = meta.editor.ObjectFactory.CreateGameObject(obj.name, [T])
+                meta.editor.Undo.RegisterCreatedObjectUndo(go, "Create %s" % obj.name)
+                return self.Object(go.name)
+            else:
+                # prefab = PrefabUtility.CreatePrefab("Assets/camera_test.prefab", go)
+                # PrefabUtility.ReplacePrefab(go, prefab, ReplacePrefabOptions.ConnectToPrefab)
+                # issubclass(cm, meta.engine.Object)
+                instance = meta.editor.ObjectFactory.CreateInstance(cm)
+                return meta.editor.AssetDatabase.CreateAsset(instance, "Assets/%s" % obj.name)
+
+        elif go and isinstance(cm, meta.engine.Component):
+            meta.editor.Undo.AddComponent(go, cm)
+            return self.Object(cm.name)
+
+    def create_many(self, specs):
+        import clr
+
+        nodes = []
+        for kind, name, parent, attrs in specs:
+            types = [clr.GetClrType(getattr(meta.engine, kind))] if kind else []
+            go = meta.editor.ObjectFactory.CreateGameObject(name or kind, types)
+            meta.editor.Undo.RegisterCreatedObjectUndo(go, "Create %s" % go.name)
+            if parent:
+                go.transform.SetParent(meta.engine.GameObject.Find(_name(parent)).transform)
+            node = self.Node(go.name)
+            if attrs:
+                self.set_attrs(node, attrs)
+            nodes.append(node)
+        return nodes
+
+    def depth(self, obj):
+        depth, transform = 0, self.handle(obj).transform.parent
+        while transform is not None:
+            depth, transform = depth + 1, transform.parent
+        return depth
+
+    def delete(self, obj, *args, **kwargs):
+        go = self.handle(obj)
+        if go:
+            self.release(obj)
+            return meta.editor.Undo.DestroyObjectImmediate(go)
+        else:
+            return meta.editor.AssetDatabase.DeleteAsset(obj.name)
+
+    def instance(self, obj, *args, **kwargs):
+        go = self.handle(obj)
+        if go:
+            return go.Instantiate(go, *args)
+        else:
+            meta.editor.AssetDatabase.CopyAsset(obj.name, args[0])
+            asset = meta.editor.AssetDatabaseLoadAssetAtPath(*args[1:])
+            meta.editor.EditorUtility.SetDirty(asset)
+            return self.Object(asset.name)
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return setattr(
+                meta.editor.Selection.activeGameObject,
+                meta.engine.GameObject.Find(*args)
+            )
+
+    def hide(self, obj, on=True):
+        return self.handle(obj).SetActive(not on)
+
+    def parent(self, obj, *args, **kwargs):
+        transform = self.handle(obj).transform
+        if len(args) > 0:
+            parent = meta.engine.GameObject.Find(args[0]).transform
+            meta.editor.Undo.SetTransformParent(transform, parent, "%s Parenting" % transform.name)
+            return self.Object(parent.name)
+        else:
+            return self.Object(transform.parent.name) if transform.parent else None
+
+    def children(self, obj, *args, **kwargs):
+        transform = self.handle(obj).transform
+        return (self.Object(transform.GetChild(i).name) for i in range(transform.childCount))
+
+    def hierarchy(self, obj):
+        transforms = self.handle(obj).GetComponentsInChildren(meta.engine.Transform, True)
+        return [(t.name, t.parent.name) for t in list(transforms)[1:]]
+
+    def value(self, attr):
+        return getattr(self.raw(attr), attr.val)
+
+    def set_value(self, attr, *args, **kwargs):
+        go = self.owner(attr)
+        meta.editor.Undo.RecordObject(go, "Inspector")
+
+        for com in go.GetComponentsInChildren(meta.engine.Component):
+            if attr.val in dir(go.GetComponent(com.GetType())):
+                return setattr(go.GetComponent(com.GetType()), attr.val, args[0])
+
+    def open(self, cls, *args, **kwargs):
+        return cls(meta.editor.AssetDatabase.ImportAsset(*args, **kwargs))
+
+    def save(self, cls, *args, **kwargs):
+        return
+
+    def current(self, f):
+        return meta.editor.AssetDatabase.GetAssetOrScenePath()
+
+
+@register("BVH3")
+class Rumba(Backend):
+    """Rumba"""
+
+    def id(self, obj):
+        return meta.active_document()
+
+    def rename(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(args[0])
+        return node.rename(args[1])
+
+    def attr(self, obj, val, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return self._attribute(node.plug(val), obj, val)
+
+    def attrs(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return (plug.name() for plug in node.plugs())
+
+    def create(self, obj, *args, **kwargs):
+        node = meta.Node(*args)
+        return self.Node(node.name())
+
+    def delete(self, obj, *args, **kwargs):
+        node = meta.active_document().find_first(obj.name)
+        return node.delete_node(True)
+
+    def select(self, obj, *args, **kwargs):
+        if len(args) == 0 and len(kwargs) == 0:
+            return self._sel()
+        else:
+            return meta.select(*args, **kwargs)
+
+    def hide(self, obj, on=True):
+        import rumbapy
+        node = meta.active_document().find_first(obj.name)
+        return rumbapy.hide([node]) if on else rumbapy.show_([node])
+
+    def parent(self, obj, *args, **kwargs):
+        node = meta.active_document().find_first(obj.name)
+        return self.Node(node.parent().name())
+
+    def children(self, obj, *args, **kwargs):
+        node = meta.active_document().find_first(obj.name)
+        return (self.Node(n.name()) for n in node.children())
+
+    def connect(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return node.plug(args[0]).connect(*args[1:], **kwargs)
+
+    def disconnect(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return node.plug(args[0]).disconnect(True)
+
+    def inputs(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return self.Node(node.plug(args[0]).input().node().name())
+
+    def outputs(self, obj, *args, **kwargs):
+        node = meta.active_document().first_name(obj.name)
+        return [self.Node(out.name()) for out in node.plug(args[0]).outputs()]
+
+    def value(self, attr):
+        return self.raw(attr).value()
+
+    def set_value(self, attr, *args, **kwargs):
+        node = meta.active_document().first_name(attr.obj)
+        return node.plug(attr.val).set_value(args[0], True)
+
+    def lock(self, attr, on=True):
+        return self.raw(attr).lock.set_value(on)
+
+    def hide_attr(self, attr, on=True):
+        return self.raw(attr).visible.set_value(not on)
+
+    def open(self, cls, *args, **kwargs):
+        return meta.load_document(*args, **kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        doc = meta.active_document()
+        return doc.write(*args, **kwargs)
+
+    def current(self, f):
+        return meta.active_document().full_document_name() + meta.active_document_filename()
+
+
+@register("SceneObject")
+class Marmoset(Backend):
+    """Marmoset Toolbag"""
+
+    id = _not_found
+
+    def rename(self, obj, *args, **kwargs):
+        meta.findObject(args[0]).name = args[1]
+        return meta.findObject(args[1])
+
+    def attr(self, obj, val, *args, **kwargs):
+        return self._attribute(meta.findObject(val), obj, val)
+
+    def attrs(self, obj, *args, **kwargs):
+        return (attr for attr in dir(meta.findObject(args[0])) if not attr.startswith("__"))
+
+    def create(self, obj, *args, **kwargs):
+        _obj = {
+            "mesh": meta.MeshObject, "material": meta.Material,
+            "light": meta.LightObject, "camera": meta.CameraObject, "fog": meta.FogObject,
+        }[args[0]](*args[1:])
+        return self.Object(_obj.name)
+
+    def delete(self, obj, *args, **kwargs):
+        return meta.findObject(obj.name).destroy()
+
+    def instance(self, obj, *args, **kwargs):
+        return self.Object(meta.findObject(obj.name).duplicate(args[0]).name)
+
+    def select(self, obj, *args, **kwargs):
+        return self._sel()
+
+    def hide(self, obj, on=True):
+        return setattr(meta.findObject(obj.name), "visible", not on)
+
+    def parent(self, obj, *args, **kwargs):
+        return self.Object(meta.findObject(obj.name).parent.name)
+
+    def children(self, obj, *args, **kwargs):
+        return (self.Object(o.name) for o in meta.findObject(obj.name).getChildren())
+
+    def set_value(self, attr, *args, **kwargs):
+        return setattr(meta.findObject(attr.val), "", args[0])
+
+    def lock(self, attr, on=True):
+        return YException("api is not found")
+
+    def hide_attr(self, attr, on=True):
+        return YException("api is not found")
+
+    def open(self, cls, *args, **kwargs):
+        return meta.loadScene(*args)
+
+    def save(self, cls, *args, **kwargs):
+        return meta.saveScene(*args)
+
+    def current(self, f):
+        return meta.getScenePath()
+
+
+@register("textureset")
+class SubstancePainter(Backend):
+    """Substance Painter"""
+
+    id = attr = attrs = create = delete = _not_found
+
+    def set_value(self, attr, *args, **kwargs):
+        return YException("api is not found")
+
+    def open(self, cls, *args, **kwargs):
+        if args[0].endswith(".spp"):
+            return meta.project.open(*args)
+        else:
+            return meta.project.create(*args, **kwargs)
+
+    def save(self, cls, *args, **kwargs):
+        if args[0].endswith(".spp"):
+            return meta.project.save_as(*args, **kwargs)
+        else:
+            return meta.export.export_project_textures(**kwargs)
+
+    def current(self, f):
+        return meta.project.file_path()
+
+
+@register("BusyData")
+class RenderDoc(Backend):
+    """RenderDoc"""
+
+    id = rename = attr = attrs = create = delete = instance = _not_found
+    select = hide = parent = children = set_value = _not_found
+
+
+def resolve():
+    """
+    resolve host backend from the current application.
+    called once at import and again when yurlungur.use switches application.
+
+    Returns: Backend
+    """
+    global host
+    previous = globals().get("host")
+    if previous is not None:
+        previous.unwatch()
+
+    for cls in _HOSTS_:
+        if getattr(meta, cls.marker, False):
+            host = cls()
+            break
+    else:
+        host = Backend()
+    event.bus.rewatch()
+    return host
+
+
+host = resolve()
@@ -4,7 +4,11 @@ import types
 import importlib
 from functools import partial, wraps
 
-from yurlungur.core.proxy import Node, Attribute, File
+from yurlungur.core import backend
+from yurlungur.core.deco import undo_step
+from yurlungur.core.exception import YException
+from yurlungur.core.proxy import Node, NodeArray, Attribute, File
+from yurlungur.core.query import Query
 from yurlungur.tool.meta import meta
 
 __all__ = [
@@ -57,19 +61,54 @@ class Command(object):
         _CMDS_.clear()
 
 
+def _set_many(cls, items):
+    """
+    write attributes of many nodes in one undo group
+    >>> yurlungur.attr.set_many([(cube, "tx", 1.0), (cube, "ty", 2.0), ("pCone1", "tx", 3.0)])
+    """
+    groups = []
+    values = {}
+    for obj, name, value in items:
+        key = obj.name if isinstance(obj, Node) else obj
+        if key not in values:
+            values[key] = {}
+            groups.append((obj, values[key]))
+        values[key][name] = value
+
+    names = [obj for obj, _ in groups if not isinstance(obj, Node)]
+    nodes = dict(zip(names, backend.host.nodes(names)))
+    groups = [(obj if isinstance(obj, Node) else nodes[obj], attrs) for obj, attrs in groups]
+
+    with undo_step("set_many"):
+        for obj, attrs in groups:
+            backend.host.forget(obj.name, attrs)
+            backend.host.set_attrs(obj, attrs)
+
+
 # Monkey-Patch for attribute
 attr = Attribute()
 Attribute.create = None
 Attribute.delete = None
+Attribute.set_many = _set_many
 
 
 def _rm(cls, *args):
-    for obj in args:
-        try:
-            node = cls(obj.name)
-            node.delete()
-        except:
-            pass
+    """
+    delete nodes in one undo group, children before parents.
+    every node is tried and failures are raised together at the end.
+    >>> yurlungur.node.rm(*yurlungur.node.ls("pCube*"))
+    """
+    nodes = [obj if isinstance(obj, Node) else Node(obj) for obj in args]
+    if not nodes:
+        return
+    backend.host.invalidate()
+    with undo_step("rm"):
+        failures = backend.host.delete_many(nodes)
+
+    if failures:
+        raise YException(
+            "failed to delete: " + ", ".join("%s (%s)" % (k, v) for k, v in sorted(failures.items()))
+        )
 
 
 def _ls(cls, *args, **kwargs):
@@ -77,7 +116,7 @@ def _ls(cls, *args, **kwargs):
     if getattr(meta, "SDNode", False):
         return
     if getattr(meta, "ls", False):
-        gen = meta.ls(*args, **kwargs)
+        return NodeArray(backend.host.nodes(meta.ls(*args, **kwargs) or []))
     if getattr(meta, "hda", False):
         gen = meta.pwd().allItems()
     if getattr(meta, "data", False):
@@ -102,14 +141,14 @@ def _ls(cls, *args, **kwargs):
         gen = meta.getAllObjects()
     if getattr(meta, "textureset", False):
         return
-    return (cls(obj) for obj in gen)
+    return NodeArray(Node(obj) for obj in gen)
 
 
 def _glob(cls, *args, **kwargs):
     if getattr(meta, "SDNode", False):
         return
     if getattr(meta, "ls", False):
-        gen = meta.ls(*args, **kwargs)
+        return NodeArray(backend.host.nodes(meta.ls(*args, **kwargs) or []))
     if getattr(meta, "hda", False):
         gen = meta.pwd().glob(*args, **kwargs)
     if getattr(meta, "data", False):
@@ -134,31 +173,55 @@ def _glob(cls, *args, **kwargs):
         return
     if getattr(meta, "textureset", False):
         return
-    return tuple(cls(obj) for obj in gen)
+    return NodeArray(Node(obj) for obj in gen)
+
+
+def _query(cls, type=None, pattern=None, regex=None, root=None, **where):
+    """
+    query nodes, filters are pushed down to the host where possible
+    >>> yurlungur.node.query(type="mesh", pattern="pCube*", root="|grp", visibility=True).pages(100)
+
+    Args:
+        type: node type
+        pattern: fnmatch pattern of full or short name
+        regex: regular expression searched in full name
+        root: descendants of root only
+        **where: attribute value or callable which takes value
+
+    Returns: Query
+    """
+    return Query(type, pattern, regex, root, where)
 
 
 def _select(cls, *args, **kwargs):
+    """
+    current selection, kept until the host reports selection change
+    >>> yurlungur.node.sel()
+    """
+    if args or kwargs:
+        return _selected(*args, **kwargs)
+    return backend.host.selection(_selected)
+
+
+def _selected(*args, **kwargs):
     if getattr(meta, "select", False):
-        return (cls(obj) for obj in meta.ls(sl=True))
+        return NodeArray(backend.host.nodes(meta.ls(sl=True) or []))
 
     if getattr(meta, "hda", False):
-        return (cls(obj.path()) for obj in meta.selectedNodes(args))
+        return NodeArray(Node(obj) for obj in meta.selectedNodes(args))
 
     if getattr(meta, "SDNode", False):
         context = meta.sd_app.getUIMgr()
-        return (
-            cls(node.getDefinition().getLabel())
+        return NodeArray(backend.host.nodes(
+            node.getDefinition().getLabel()
             for node in context.getCurrentGraphSelection()
-        )
+        ))
 
     if getattr(meta, "runtime", False):
-        if meta.runtime.execute("$") == meta.runtime.execute("$selection", False):
-            return (cls(obj.name) for obj in meta.runtime.execute("$ as array"))
-        else:
-            return cls(meta.runtime.execute("$"))
+        return NodeArray(backend.host.nodes(obj.name for obj in meta.runtime.execute("$selection as array")))
 
     if getattr(meta, "data", False):
-        return (cls(obj.name) for obj in meta.context.selected_objects)
+        return NodeArray(backend.host.nodes(obj.name for obj in meta.context.selected_objects))
 
     if getattr(meta, "C4DAtom", False):
         if len(args) == 0 and len(kwargs) == 0:
@@ -166,28 +229,28 @@ def _select(cls, *args, **kwargs):
         return meta.doc.GetActiveObject().GetName()
 
     if getattr(meta, "knob", False):
-        return (cls(node.name) for node in meta.selectedNodes())
+        return NodeArray(backend.host.nodes(node.name for node in meta.selectedNodes()))
 
     if getattr(meta, "doc", False):
         try:
-            return cls(meta.doc.ActiveLayer.name)
+            return Node(meta.doc.ActiveLayer.name)
         except AttributeError:
-            return cls(meta.doc.currentLayer().name())
+            return Node(meta.doc.currentLayer().name())
 
     if getattr(meta, "uclass", False):
-        return (
-            cls(asset.get_name())
+        return NodeArray(backend.host.nodes(
+            asset.get_name()
             for asset in meta.editor.get_selected_assets()
-        )
+        ))
 
     if getattr(meta, "Debug", False):
-        return (cls(go.name) for go in meta.editor.Selection.gameObjects)
+        return NodeArray(backend.host.nodes(go.name for go in meta.editor.Selection.gameObjects))
 
     if getattr(meta, "BVH3", False):
-        return (cls(node.name()) for node in meta.selection())
+        return NodeArray(backend.host.nodes(node.name() for node in meta.selection()))
 
     if getattr(meta, "SceneObject", False):
-        return (cls(obj.name) for obj in meta.getSelectedObjects())
+        return NodeArray(backend.host.nodes(obj.name for obj in meta.getSelectedObjects()))
 
 
 def _abcImporter(cls, *args, **kwargs):
@@ -563,6 +626,7 @@ Node.ls = _ls
 Node.sel = _select
 Node.rm = _rm
 Node.glob = _glob
+Node.query = _query
 
 
 def _Bake(cls, *args, **kwargs):
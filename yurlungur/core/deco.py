@@ -124,6 +124,25 @@ else:
                 meta.editor.Undo.CollapseUndoOperations(self.index)
 
 
+@contextlib.contextmanager
+def undo_step(label):
+    """
+    one undo step for batched writes.
+    UndoGroup of blender and photoshop goes back to the state at enter,
+    so blender pushes an undo step at exit and photoshop keeps each write in history.
+    """
+    if env.Blender():
+        try:
+            yield
+        finally:
+            meta.ops.ed.undo_push(message=label)
+    elif env.Photoshop():
+        yield
+    else:
+        with UndoGroup(label):
+            yield
+
+
 def cache(func, *args, **kwargs):
     """
     Substance, Blender and Davinch use lcu_cache at Python3.
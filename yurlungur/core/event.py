@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+host event bus.
+
+every host callback is turned into (kind, name) and queued,
+repeated events are merged and subscribers get one batch per kind
+after the host has been quiet for the debounce delay.
+hosts which have no event loop deliver batches from a timer thread.
+"""
+import time
+import threading
+import contextlib
+from collections import OrderedDict
+
+__all__ = ["ADDED", "REMOVED", "RENAMED", "CHANGED", "OPENED", "SAVED", "EventBus", "bus"]
+
+ADDED, REMOVED, RENAMED, CHANGED, OPENED, SAVED = (
+    "added", "removed", "renamed", "changed", "opened", "saved"
+)
+KINDS = ADDED, REMOVED, RENAMED, CHANGED, OPENED, SAVED
+
+
+class EventBus(object):
+    """
+    >>> def reload(kind, names):
+    >>>     print(kind, names)
+    >>> yurlungur.event.bus.subscribe(reload, kinds=[yurlungur.event.ADDED])
+    >>> with yurlungur.event.bus.hold():
+    >>>     yurlungur.node.rm("pCube1", "pCube2")
+    """
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self._subscribers = []
+        self._pending = OrderedDict()
+        self._last = 0.0
+        self._holds = 0
+        self._scheduled = False
+        self._watching = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<EventBus subscribers:%d pending:%d>" % (len(self._subscribers), len(self._pending))
+
+    def subscribe(self, callback, kinds=None):
+        """
+        Args:
+            callback: callable which takes kind and names, None in names is unknown node
+            kinds: event kinds, every kind when None
+
+        Returns: callback
+        """
+        if self._watching is None:
+            from yurlungur.core import backend
+            self._watching = bool(backend.host.watch(self.emit))
+        self._subscribers.append((callback, frozenset(kinds or KINDS)))
+        return callback
+
+    def rewatch(self):
+        """install host callbacks again after yurlungur.use replaced the backend"""
+        self._watching = None
+        if self._subscribers:
+            from yurlungur.core import backend
+            self._watching = bool(backend.host.watch(self.emit))
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(fn, kinds) for fn, kinds in self._subscribers if fn != callback]
+
+    @property
+    def watching(self):
+        """True when the host sends events"""
+        return bool(self._watching)
+
+    def emit(self, kind, name=None):
+        """queue event from host callback"""
+        with self._lock:
+            if kind == REMOVED and name is not None and self._pending.pop((ADDED, name), False):
+                return
+            self._pending[kind, name] = True
+            self._last = time.time()
+        if self._holds or self._scheduled:
+            return
+        self._schedule()
+
+    def _schedule(self):
+        from yurlungur.core import backend
+        self._scheduled = True
+        if not backend.host.defer(self._tick, self.delay):
+            timer = threading.Timer(self.delay, self._tick)
+            timer.daemon = True
+            timer.start()
+
+    def _tick(self):
+        if self._holds == 0 and time.time() - self._last < self.delay:
+            self._schedule()
+            return
+        self._scheduled = False
+        if self._holds == 0:
+            self.flush()
+
+    @contextlib.contextmanager
+    def hold(self):
+        """merge events until the outermost block ends"""
+        self._holds += 1
+        try:
+            yield self
+        finally:
+            self._holds -= 1
+            if self._holds == 0 and not self._scheduled:
+                self.flush()
+
+    def flush(self):
+        """deliver queued events, one call per kind"""
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+        batches = OrderedDict()
+        for kind, name in pending:
+            batches.setdefault(kind, []).append(name)
+
+        for kind, names in batches.items():
+            for callback, kinds in list(self._subscribers):
+                if kind in kinds:
+                    callback(kind, names)
+
+
+bus = EventBus()
@@ -13,6 +13,14 @@ class YException(RuntimeError):
     pass
 
 
+class YGeometryException(YException):
+    """
+    node has no geometry
+    >>> raise YGeometryException(node.name)
+    """
+    pass
+
+
 class YEnvException(OSError):
     """
     env error
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+mesh buffers as numpy arrays.
+
+each host fills the arrays with its bulk getter
+(bpy foreach_get, hou attrib values as bytes, MFnMesh arrays)
+and writes them back the same way.
+"""
+import hashlib
+
+from yurlungur.core import backend
+from yurlungur.core.deco import undo_step
+from yurlungur.core.exception import YGeometryException
+
+__all__ = ["GeometryBuffer", "duplicates", "instance_duplicates"]
+
+
+class GeometryBuffer(object):
+    """
+    >>> geo = yurlungur.Node("pCube1").geometry
+    >>> geo.points = geo.points + (0.0, 1.0, 0.0)
+    >>> geo.commit()
+
+    arrays read from houdini are read only views of the host buffer,
+    assign new arrays instead of writing in place.
+    """
+    __slots__ = ("node", "points", "normals", "uvs", "counts", "indices")
+
+    def __init__(self, node, points, normals=None, uvs=None, counts=None, indices=None):
+        self.node = node
+        self.points = points
+        self.normals = normals
+        self.uvs = uvs
+        self.counts = counts
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return "<GeometryBuffer %s points:%d faces:%d>" % (
+            self.node.name, len(self.points), 0 if self.counts is None else len(self.counts)
+        )
+
+    @classmethod
+    def read(cls, node):
+        """
+        Args:
+            node: Node of mesh
+
+        Returns: GeometryBuffer
+        """
+        return cls(node, **backend.host.get_geometry(node))
+
+    def digest(self, precision=1e-4):
+        """
+        content hash from point count, topology, quantized object space points, normals and uvs.
+        meshes which differ only in transform have the same digest.
+
+        Args:
+            precision: grid size of points
+
+        Returns: hex string
+        """
+        import numpy as np
+
+        def grid(buffer):
+            if buffer is None:
+                return np.empty(0, np.int64)
+            return np.round(np.asarray(buffer, np.float64) / precision).astype(np.int64)
+
+        sha = hashlib.sha1(str(len(self.points)).encode())
+        for buffer in self.counts, self.indices:
+            sha.update(np.ascontiguousarray(buffer, np.int32).tobytes())
+        # shapes keep the buffers apart
+        for buffer in self.points, self.normals, self.uvs:
+            values = grid(buffer)
+            sha.update(str(values.shape).encode())
+            sha.update(values.tobytes())
+        return sha.hexdigest()
+
+    @property
+    def faces(self):
+        """point indices of each face"""
+        import numpy as np
+        return np.split(self.indices, np.cumsum(self.counts)[:-1])
+
+    def commit(self, normals=False, uvs=False):
+        """
+        write points back in one undo group, topology must be unchanged
+
+        Args:
+            normals: write normals too
+            uvs: write uvs too
+        """
+        with undo_step("geometry"):
+            return backend.host.set_geometry(
+                self.node, self.points,
+                self.normals if normals else None,
+                self.uvs if uvs else None,
+            )
+
+
+def duplicates(nodes, precision=1e-4):
+    """
+    groups of meshes which have the same content
+    >>> yurlungur.geometry.duplicates(yurlungur.node.query(type="mesh"))
+
+    Args:
+        nodes: Node or name of meshes, nodes which have no geometry are skipped
+        precision: grid size of points
+
+    Returns: [[master, duplicate, ...], ...]
+    """
+    groups = {}
+    for node in nodes:
+        node = node if isinstance(node, backend.host.Object) else backend.host.Node(node)
+        try:
+            digest = GeometryBuffer.read(node).digest(precision)
+        except YGeometryException:
+            continue
+        groups.setdefault(digest, []).append(node)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def instance_duplicates(nodes, precision=1e-4):
+    """
+    replace duplicates with instances of the first mesh of each group in one undo group
+
+    Args:
+        nodes: Node or name of meshes
+        precision: grid size of points
+
+    Returns: {duplicate name: Node of instance}
+    """
+    groups = duplicates(nodes, precision)
+    instances = {}
+    backend.host.invalidate()
+    with undo_step("instance_duplicates"):
+        for group in groups:
+            master = group[0]
+            for target in group[1:]:
+                name = target.name
+                instances[name] = backend.host.replace_with_instance(master, target)
+    return instances
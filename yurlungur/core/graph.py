@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+connection graph of a network as CSR arrays.
+
+nodes are numbered by the name table,
+edges run from source (upstream) to destination (downstream).
+every query works in python without calling the host.
+"""
+import array
+from collections import deque
+
+from yurlungur.core import env
+from yurlungur.core.exception import YException
+
+__all__ = ["Graph"]
+
+
+def _ints(values):
+    np = env.Numpy()
+    return np.asarray(values, dtype=np.int32) if np else array.array("i", values)
+
+
+class Graph(object):
+    """
+    >>> graph = yurlungur.Node("/obj").graph()
+    >>> graph.topological()
+    >>> graph.upstream("/obj/geo1")
+    """
+    __slots__ = ("names", "indptr", "indices", "_index", "_reverse")
+
+    def __init__(self, names, indptr, indices):
+        self.names = tuple(names)
+        self.indptr = indptr
+        self.indices = indices
+        self._index = dict((name, i) for i, name in enumerate(self.names))
+        self._reverse = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return "<Graph nodes:%d edges:%d>" % (len(self.names), len(self.indices))
+
+    def __getstate__(self):
+        return self.names, self.indptr, self.indices
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def from_edges(cls, names, edges):
+        """
+        build from name table and edges
+
+        Args:
+            names: node names, edges to names out of the table are appended
+            edges: (source name, destination name)
+
+        Returns: Graph
+        """
+        names = list(names)
+        index = dict((name, i) for i, name in enumerate(names))
+        pairs = []
+        for src, dst in edges:
+            for name in src, dst:
+                if name not in index:
+                    index[name] = len(names)
+                    names.append(name)
+            pairs.append((index[src], index[dst]))
+
+        pairs = sorted(set(pairs))
+        indptr = [0] * (len(names) + 1)
+        for src, _ in pairs:
+            indptr[src + 1] += 1
+        for i in range(len(names)):
+            indptr[i + 1] += indptr[i]
+
+        return cls(names, _ints(indptr), _ints([dst for _, dst in pairs]))
+
+    @property
+    def edges(self):
+        """(source name, destination name) of all edges"""
+        return [
+            (self.names[i], self.names[self.indices[j]])
+            for i in range(len(self.names))
+            for j in range(self.indptr[i], self.indptr[i + 1])
+        ]
+
+    def index(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise YException("%s is not in graph" % name)
+
+    def outputs(self, name):
+        i = self.index(name)
+        return [self.names[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def inputs(self, name):
+        return self.reverse().outputs(name)
+
+    def reverse(self):
+        """graph of which edges are flipped"""
+        if self._reverse is None:
+            self._reverse = Graph.from_edges(self.names, ((d, s) for s, d in self.edges))
+            self._reverse._reverse = self
+        return self._reverse
+
+    def _closure(self, name):
+        start = self.index(name)
+        seen = set([start])
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            for j in self.indices[self.indptr[i]:self.indptr[i + 1]]:
+                if j not in seen:
+                    seen.add(j)
+                    queue.append(j)
+        seen.discard(start)
+        return [self.names[i] for i in sorted(seen)]
+
+    def downstream(self, name):
+        """every node which name feeds"""
+        return self._closure(name)
+
+    def upstream(self, name):
+        """every node which feeds name"""
+        return self.reverse()._closure(name)
+
+    def topological(self):
+        """
+        names ordered sources first.
+        raise YException when the graph has cycle.
+        """
+        count = [0] * len(self.names)
+        for j in self.indices:
+            count[j] += 1
+
+        queue = deque(i for i, c in enumerate(count) if c == 0)
+        order = []
+        while queue:
+            i = queue.popleft()
+            order.append(self.names[i])
+            for j in self.indices[self.indptr[i]:self.indptr[i + 1]]:
+                count[j] -= 1
+                if count[j] == 0:
+                    queue.append(j)
+
+        if len(order) < len(self.names):
+            raise YException("graph has cycle: %s" % self.cycle())
+        return order
+
+    def cycle(self):
+        """names of one cycle, None when the graph is acyclic"""
+        state = [0] * len(self.names)  # 0: new, 1: on stack, 2: done
+        for root in range(len(self.names)):
+            if state[root]:
+                continue
+
+            path = [root]
+            stack = [iter(self.indices[self.indptr[root]:self.indptr[root + 1]])]
+            state[root] = 1
+            while stack:
+                for j in stack[-1]:
+                    if state[j] == 1:
+                        return [self.names[i] for i in path[path.index(j):]]
+                    if state[j] == 0:
+                        state[j] = 1
+                        path.append(j)
+                        stack.append(iter(self.indices[self.indptr[j]:self.indptr[j + 1]]))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    stack.pop()
+        return None
+
+    @property
+    def acyclic(self):
+        return self.cycle() is None
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+animation curves as arrays.
+
+a whole curve is read or written in a few host calls,
+times, values and slopes (value per frame) are numpy arrays
+or array module arrays when numpy is missing.
+"""
+import array
+
+from yurlungur.core import backend, env
+from yurlungur.core.deco import undo_step
+
+__all__ = ["Curve", "read", "write"]
+
+
+def _floats(values):
+    np = env.Numpy()
+    return np.asarray(values, dtype=np.float64) if np else array.array("d", values)
+
+
+class Curve(object):
+    """
+    >>> curves = yurlungur.keyframe.read("hips", ["tx", "ty"])
+    >>> yurlungur.keyframe.write("root", dict((k, c.retime(offset=-1000)) for k, c in curves.items()))
+    """
+    __slots__ = ("times", "values", "in_slopes", "out_slopes")
+
+    def __init__(self, times, values, in_slopes=None, out_slopes=None):
+        assert len(times) == len(values), "length of values is invalid."
+        self.times = _floats(times)
+        self.values = _floats(values)
+        self.in_slopes = None if in_slopes is None else _floats(in_slopes)
+        self.out_slopes = None if out_slopes is None else _floats(out_slopes)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __repr__(self):
+        if not len(self):
+            return "<Curve keys:0>"
+        return "<Curve keys:%d frames:%g-%g>" % (len(self), self.times[0], self.times[-1])
+
+    def __getstate__(self):
+        return self.times, self.values, self.in_slopes, self.out_slopes
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def retime(self, offset=0.0, scale=1.0):
+        """
+        Args:
+            offset: frames added after scaling
+            scale: time scale, slopes are divided by it
+
+        Returns: Curve
+        """
+        def slope(slopes):
+            return None if slopes is None else [s / scale for s in slopes]
+
+        return Curve(
+            [t * scale + offset for t in self.times], list(self.values),
+            slope(self.in_slopes), slope(self.out_slopes)
+        )
+
+
+def _node(node):
+    return node if isinstance(node, backend.host.Object) else backend.host.Node(node)
+
+
+def read(node, names):
+    """
+    Args:
+        node: Node or name
+        names: attribute names
+
+    Returns: {name: Curve}
+    """
+    node = _node(node)
+    return dict((name, Curve(*backend.host.get_keys(node, name))) for name in names)
+
+
+def write(node, curves):
+    """
+    replace curves in one undo group
+
+    Args:
+        node: Node or name
+        curves: {name: Curve}
+    """
+    node = _node(node)
+    with undo_step("keyframe"):
+        for name, curve in curves.items():
+            backend.host.forget(node.name, [name])
+            backend.host.set_keys(
+                node, name, curve.times.tolist(), curve.values.tolist(),
+                None if curve.in_slopes is None else curve.in_slopes.tolist(),
+                None if curve.out_slopes is None else curve.out_slopes.tolist(),
+            )
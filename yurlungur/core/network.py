@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+declarative network.
+
+nodes, parameters and connections are described first
+and created in one undo group, connections after every node exists.
+"""
+from collections import namedtuple
+
+from yurlungur.core import backend
+from yurlungur.core.deco import undo_step
+from yurlungur.core.exception import YException
+from yurlungur.core.proxy import NodeArray
+
+__all__ = ["Network", "Spec", "Link"]
+
+Spec = namedtuple("Spec", "type name parent attrs")
+Link = namedtuple("Link", "source destination input output")
+
+
+class Network(object):
+    """
+    >>> net = yurlungur.Network("/obj/geo1")
+    >>> net.node("box", "box1", sizex=2.0)
+    >>> net.node("xform", "move", ty=1.0)
+    >>> net.connect("box1", "move")
+    >>> box, move = net.build()
+
+    inputs and outputs are index on houdini and nuke,
+    plug name on maya, substance designer and fusion.
+    parent is a group on nuke and not supported on fusion.
+    """
+    __slots__ = ("parent", "specs", "links")
+
+    def __init__(self, parent=None, specs=(), links=()):
+        self.parent = parent
+        self.specs = [Spec(*spec) for spec in specs]
+        self.links = [Link(*link) for link in links]
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __repr__(self):
+        return "<Network nodes:%d links:%d>" % (len(self.specs), len(self.links))
+
+    @property
+    def names(self):
+        return [spec.name for spec in self.specs]
+
+    def node(self, type, name, parent=None, **attrs):
+        """
+        Args:
+            type: node type
+            name: node name, used by connect
+            parent: parent node, the network parent when None
+            **attrs: attribute values
+
+        Returns: name
+        """
+        if name in self.names:
+            raise YException("%s is already in network" % name)
+        self.specs.append(Spec(type, name, parent, attrs))
+        return name
+
+    def connect(self, source, destination, input=None, output=None):
+        """
+        Args:
+            source: name in network or in the scene
+            destination: name in network or in the scene
+            input: input of destination, the first one when None
+            output: output of source, the first one when None
+        """
+        self.links.append(Link(source, destination, input, output))
+        return self
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        >>> Network.from_dict({
+        >>>     "parent": "/obj/geo1",
+        >>>     "nodes": [{"type": "box", "name": "box1", "attrs": {"sizex": 2.0}}],
+        >>>     "connections": [{"source": "box1", "destination": "/obj/geo1/out"}],
+        >>> })
+        """
+        net = cls(data.get("parent"))
+        for node in data.get("nodes", ()):
+            net.node(node["type"], node["name"], node.get("parent"), **node.get("attrs", {}))
+        for link in data.get("connections", ()):
+            net.connect(link["source"], link["destination"], link.get("input"), link.get("output"))
+        return net
+
+    def to_dict(self):
+        return {
+            "parent": self.parent,
+            "nodes": [dict(spec._asdict(), attrs=dict(spec.attrs)) for spec in self.specs],
+            "connections": [link._asdict() for link in self.links],
+        }
+
+    def build(self):
+        """
+        create every node and connection in one undo group
+
+        Returns: NodeArray in the order of nodes
+        """
+        specs = [
+            (spec.type, spec.name, spec.parent or self.parent, spec.attrs) for spec in self.specs
+        ]
+        backend.host.invalidate()
+        with undo_step("build"):
+            return NodeArray(backend.host.build(specs, list(self.links)))
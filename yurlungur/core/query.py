@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+node query with filter pushdown.
+
+type, name pattern and hierarchy scope are handed to the host in one call,
+regex and attribute predicates run on the names which come back,
+and results are read lazily page by page.
+"""
+import re
+import itertools
+
+from yurlungur.core import backend
+from yurlungur.core.proxy import NodeArray
+
+__all__ = ["Query"]
+
+
+def _chunks(names, size=256):
+    names = iter(names)
+    while True:
+        chunk = list(itertools.islice(names, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Query(object):
+    """
+    >>> meshes = yurlungur.node.query(type="mesh", pattern="*body*", root="|char")
+    >>> meshes = meshes.where(visibility=True, tx=lambda v: v > 0)
+    >>> for page in meshes.pages(100):
+    >>>     page.attr("tx").values
+    """
+    __slots__ = ("_type", "_pattern", "_regex", "_root", "_where")
+
+    def __init__(self, type=None, pattern=None, regex=None, root=None, where=None):
+        self._type = type
+        self._pattern = pattern
+        self._regex = re.compile(regex) if isinstance(regex, str) else regex
+        self._root = root
+        self._where = dict(where or {})
+
+    def __repr__(self):
+        terms = [
+            "%s=%r" % (key, value) for key, value in (
+                ("type", self._type), ("pattern", self._pattern),
+                ("regex", self._regex and self._regex.pattern), ("root", self._root),
+            ) if value is not None
+        ]
+        terms.extend("%s=%r" % item for item in sorted(self._where.items()))
+        return "Query(%s)" % ", ".join(terms)
+
+    def _with(self, **kwargs):
+        query = Query(self._type, self._pattern, self._regex, self._root, self._where)
+        for key, value in kwargs.items():
+            setattr(query, "_" + key, value)
+        return query
+
+    def type(self, kind):
+        return self._with(type=kind)
+
+    def name(self, pattern):
+        """fnmatch pattern of full or short name"""
+        return self._with(pattern=pattern)
+
+    def match(self, regex):
+        """regular expression searched in full name"""
+        return self._with(regex=re.compile(regex) if isinstance(regex, str) else regex)
+
+    def under(self, root):
+        """descendants of root only"""
+        return self._with(root=root)
+
+    def where(self, **values):
+        """
+        attribute predicates, value or callable which takes value
+        >>> query.where(visibility=True, tx=lambda v: v > 0)
+        """
+        where = dict(self._where)
+        where.update(values)
+        return self._with(where=where)
+
+    def names(self):
+        """
+        matched names, read lazily
+
+        Returns: generator of names
+        """
+        host = backend.host
+        root = self._root
+        if root is not None and not isinstance(root, host.Object):
+            root = host.Node(root)
+
+        attrs = list(self._where)
+        names = (
+            name for name in host.find(self._type, self._pattern, root)
+            if self._regex is None or self._regex.search(name)
+        )
+        if not attrs:
+            for name in names:
+                yield name
+            return
+
+        for chunk in _chunks(names):
+            for name, node in zip(chunk, host.nodes(chunk)):
+                if self._test(host.get_attrs(node, attrs) or {}):
+                    yield name
+
+    def _test(self, values):
+        for attr, expected in self._where.items():
+            if attr not in values:
+                return False
+            if callable(expected):
+                if not expected(values[attr]):
+                    return False
+            elif values[attr] != expected:
+                return False
+        return True
+
+    def __iter__(self):
+        # host ids of a chunk are fetched in one call
+        for chunk in _chunks(self.names()):
+            for node in backend.host.nodes(chunk):
+                yield node
+
+    def __getitem__(self, index):
+        """
+        slice is read without reading the rest, negative index reads everything
+        >>> yurlungur.node.query(type="mesh")[100:200]
+        """
+        if isinstance(index, slice):
+            if any(i is not None and i < 0 for i in (index.start, index.stop, index.step)):
+                return NodeArray(list(self)[index])
+            return NodeArray(itertools.islice(iter(self), index.start, index.stop, index.step))
+        if index < 0:
+            return list(self)[index]
+        for node in itertools.islice(iter(self), index, None):
+            return node
+        raise IndexError(index)
+
+    def pages(self, size=100):
+        """
+        Args:
+            size: nodes per page
+
+        Returns: generator of NodeArray
+        """
+        nodes = iter(self)
+        while True:
+            page = NodeArray(itertools.islice(nodes, size))
+            if not page:
+                return
+            yield page
+
+    def first(self):
+        """first matched node or None"""
+        for node in self:
+            return node
+        return None
+
+    def count(self):
+        return sum(1 for _ in self.names())
+
+    def all(self):
+        return NodeArray(self)
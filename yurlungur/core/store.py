@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+"""
+columnar scene snapshot.
+
+one capture pass reads names, hierarchy, types and chosen attributes,
+and every query after that runs offline.
+strings are interned into one table and columns hold indices into it.
+"""
+import array
+import pickle
+import itertools
+import fnmatch
+from collections import namedtuple
+
+from yurlungur.core import backend, env, transform
+from yurlungur.core.exception import YException
+
+__all__ = ["Snapshot", "Diff", "snapshot"]
+
+_NUMBER, _STRING, _VECTOR, _OBJECT = "number", "string", "vector", "object"
+
+
+def _ints(values):
+    np = env.Numpy()
+    return np.asarray(values, dtype=np.int32) if np else array.array("i", values)
+
+
+def _floats(values):
+    np = env.Numpy()
+    return np.asarray(values, dtype=np.float64) if np else array.array("d", values)
+
+
+def _is_number(value):
+    return isinstance(value, (bool, int, float))
+
+
+def _hash(value):
+    try:
+        return hash(value)
+    except TypeError:
+        return hash(repr(value))
+
+
+class Diff(namedtuple("Diff", "added removed renamed changed")):
+    """
+    added, removed: names
+    renamed: {old name: new name}
+    changed: {name: {attr: (old value, new value)}}
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return any(self)
+
+    __nonzero__ = __bool__
+
+
+class Snapshot(object):
+    """
+    >>> snap = yurlungur.snapshot(attrs=["tx", "visibility"])
+    >>> snap.select(type="mesh", pattern="*body*", visibility=True)
+    >>> snap.save("publish.snap")
+    >>> snap = yurlungur.Snapshot.load("publish.snap")
+    """
+    __slots__ = ("strings", "names", "parents", "types", "columns", "_index", "_digests")
+
+    def __init__(self, strings, names, parents, types, columns):
+        self.strings = strings
+        self.names = names
+        self.parents = parents
+        self.types = types
+        self.columns = columns
+        self._index = None
+        self._digests = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return (self.strings[i] for i in self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __repr__(self):
+        return "<Snapshot nodes:%d attrs:%s>" % (len(self), sorted(self.columns))
+
+    def __getstate__(self):
+        return self.strings, self.names, self.parents, self.types, self.columns
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def build(cls, rows, values=None):
+        """
+        build from plain rows
+
+        Args:
+            rows: (name, parent name, type)
+            values: {attr: [value per row]}, None is missing
+
+        Returns: Snapshot
+        """
+        strings = []
+        table = {}
+
+        def intern(text):
+            if text not in table:
+                table[text] = len(strings)
+                strings.append(text)
+            return table[text]
+
+        rows = list(rows)
+        row_of = dict((name, i) for i, (name, _, _) in enumerate(rows))
+        names = _ints([intern(name) for name, _, _ in rows])
+        parents = _ints([row_of.get(parent, -1) for _, parent, _ in rows])
+        types = _ints([intern(kind or "") for _, _, kind in rows])
+
+        columns = {}
+        for attr, column in (values or {}).items():
+            present = [v for v in column if v is not None]
+            if all(_is_number(v) for v in present):
+                columns[attr] = _NUMBER, _floats(
+                    [float("nan") if v is None else float(v) for v in column]
+                )
+            elif all(isinstance(v, str) for v in present):
+                columns[attr] = _STRING, _ints(
+                    [-1 if v is None else intern(v) for v in column]
+                )
+            elif env.Numpy() and present and all(
+                    isinstance(v, (tuple, list)) and len(v) == len(present[0])
+                    and all(_is_number(x) for x in v) for v in present):
+                nan = (float("nan"),) * len(present[0])
+                columns[attr] = _VECTOR, _floats([nan if v is None else v for v in column])
+            else:
+                columns[attr] = _OBJECT, list(column)
+
+        return cls(strings, names, parents, types, columns)
+
+    @classmethod
+    def capture(cls, root=None, attrs=()):
+        """
+        read the scene in one pass
+
+        Args:
+            root: Node or name, the whole scene when None
+            attrs: attribute names which are stored
+
+        Returns: Snapshot
+        """
+        host = backend.host
+        if root is not None and not isinstance(root, host.Object):
+            root = host.Node(root)
+
+        rows = host.scene(root)
+        values = dict((attr, []) for attr in attrs)
+        if attrs:
+            for node in host.nodes(name for name, _, _ in rows):
+                found = host.get_attrs(node, list(attrs)) or {}
+                for attr in attrs:
+                    values[attr].append(found.get(attr))
+        return cls.build(rows, values)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            snap = pickle.load(f)
+        if not isinstance(snap, cls):
+            raise YException("%s is not snapshot" % path)
+        return snap
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=2)
+        return path
+
+    @property
+    def index(self):
+        """{name: row}"""
+        if self._index is None:
+            self._index = dict((self.strings[i], row) for row, i in enumerate(self.names))
+        return self._index
+
+    def row(self, name):
+        try:
+            return self.index[name]
+        except KeyError:
+            raise YException("%s is not in snapshot" % name)
+
+    def name(self, row):
+        return self.strings[self.names[row]]
+
+    def type(self, name):
+        return self.strings[self.types[self.row(name)]]
+
+    def parent(self, name):
+        parent = self.parents[self.row(name)]
+        return self.name(parent) if parent >= 0 else None
+
+    def children(self, name):
+        row = self.row(name)
+        return [self.name(i) for i, parent in enumerate(self.parents) if parent == row]
+
+    def _decode(self, kind, value):
+        if kind == _NUMBER:
+            value = float(value)
+            return None if value != value else value
+        if kind == _STRING:
+            return None if value < 0 else self.strings[value]
+        if kind == _VECTOR:
+            value = tuple(float(v) for v in value)
+            return None if value[0] != value[0] else value
+        return value
+
+    def value(self, name, attr):
+        kind, data = self.columns[attr]
+        return self._decode(kind, data[self.row(name)])
+
+    def column(self, attr):
+        """
+        values of attr in row order.
+        numbers come back as float array with nan for missing.
+        """
+        kind, data = self.columns[attr]
+        if kind in (_NUMBER, _VECTOR):
+            return data
+        return [self._decode(kind, v) for v in data]
+
+    def world_matrices(self, attr="matrix"):
+        """
+        world matrices of every row from local matrices in attr
+        >>> snap = yurlungur.snapshot(attrs=["matrix"])
+        >>> translate, rotate, scale = yurlungur.transform.decompose(snap.world_matrices())
+
+        Returns: (rows, 4, 4) array, relative to the captured root
+        """
+        kind, data = self.columns[attr]
+        if kind != _VECTOR:
+            raise YException("%s is not matrix" % attr)
+        return transform.world_matrices(self.parents, data)
+
+    def values(self, name):
+        """{attr: value} of one node"""
+        row = self.row(name)
+        return dict(
+            (attr, self._decode(kind, data[row])) for attr, (kind, data) in self.columns.items()
+        )
+
+    def select(self, type=None, pattern=None, **where):
+        """
+        names which match every condition
+
+        Args:
+            type: node type
+            pattern: fnmatch pattern of name
+            **where: attr=value
+
+        Returns: list of names
+        """
+        rows = range(len(self))
+        if type is not None:
+            kind = self.strings.index(type) if type in self.strings else -2
+            rows = [i for i in rows if self.types[i] == kind]
+        if pattern is not None:
+            rows = [i for i in rows if fnmatch.fnmatchcase(self.name(i), pattern)]
+        for attr, expected in where.items():
+            kind, data = self.columns[attr]
+            rows = [i for i in rows if self._decode(kind, data[i]) == expected]
+        return [self.name(i) for i in rows]
+
+    def digests(self):
+        """
+        hash of each row (type and values) and of each subtree (name, row and child subtrees).
+        hashes are only comparable inside one session.
+
+        Returns: (row hashes, subtree hashes)
+        """
+        if self._digests is None:
+            rows = [
+                _hash((self.strings[self.types[i]],) + tuple(
+                    _hash(self._decode(kind, data[i])) for _, (kind, data) in sorted(self.columns.items())
+                ))
+                for i in range(len(self))
+            ]
+            children = self._children()
+            trees = [None] * len(self)
+            for i in reversed(self._order(children)):
+                trees[i] = hash((self.name(i), rows[i], tuple(sorted(trees[j] for j in children[i]))))
+            self._digests = rows, trees
+        return self._digests
+
+    def _children(self):
+        children = [[] for _ in range(len(self))]
+        for i, parent in enumerate(self.parents):
+            if parent >= 0:
+                children[parent].append(i)
+        return children
+
+    def _order(self, children):
+        order = [i for i, parent in enumerate(self.parents) if parent < 0]
+        for i in order:
+            order.extend(children[i])
+        return order
+
+    def diff(self, other=None, root=None):
+        """
+        changes from this snapshot to other.
+        subtrees whose hash is unchanged are skipped without comparing values.
+        >>> base = yurlungur.snapshot(attrs=["tx", "visibility"])
+        >>> base.diff().changed
+
+        Args:
+            other: Snapshot, the live scene under root is captured when None
+            root: Node or name used when other is None
+
+        Returns: Diff
+        """
+        if other is None:
+            other = Snapshot.capture(root, list(self.columns))
+
+        added = [name for name in other if name not in self.index]
+        removed = [name for name in self if name not in other.index]
+        renamed = self._renamed(other, removed, added)
+
+        attrs = sorted(set(self.columns) & set(other.columns))
+        rows, trees = self.digests()
+        other_rows, other_trees = other.digests()
+        children = other._children()
+        changed = {}
+
+        def compare(old, new):
+            if rows[old] == other_rows[new]:
+                return
+            values = {}
+            for attr in attrs:
+                before = self._decode(self.columns[attr][0], self.columns[attr][1][old])
+                after = other._decode(other.columns[attr][0], other.columns[attr][1][new])
+                if before != after:
+                    values[attr] = before, after
+            if values:
+                changed[other.name(new)] = values
+
+        pending = [i for i, parent in enumerate(other.parents) if parent < 0]
+        while pending:
+            new = pending.pop()
+            old = self.index.get(other.name(new))
+            if old is not None:
+                if trees[old] == other_trees[new]:
+                    continue
+                compare(old, new)
+            pending.extend(children[new])
+
+        for before, after in renamed.items():
+            compare(self.row(before), other.row(after))
+
+        renamed_after = set(renamed.values())
+        return Diff(
+            [name for name in added if name not in renamed_after],
+            [name for name in removed if name not in renamed],
+            renamed, changed
+        )
+
+    def _renamed(self, other, removed, added):
+        """
+        pair removed and added names under the same parent, after renamed parents are mapped,
+        which have the same row or the same leaf. parents are paired before their children.
+        """
+        rows, _ = self.digests()
+        other_rows, _ = other.digests()
+
+        by_row, by_leaf = {}, {}
+        for name in added:
+            parent = other.parent(name)
+            by_row.setdefault((parent, other_rows[other.row(name)]), []).append(name)
+            by_leaf.setdefault((parent, backend._leaf(name)), []).append(name)
+
+        def depth(name):
+            row, count = self.row(name), 0
+            while self.parents[row] >= 0:
+                row, count = self.parents[row], count + 1
+            return count
+
+        renamed = {}
+        taken = set()
+        removed = sorted(removed, key=depth)
+        for _, level in itertools.groupby(removed, key=depth):
+            level = list(level)
+            parents = dict((name, renamed.get(self.parent(name), self.parent(name))) for name in level)
+            for key, candidates in (
+                (lambda name: (parents[name], rows[self.row(name)]), by_row),
+                (lambda name: (parents[name], backend._leaf(name)), by_leaf),
+            ):
+                olds = {}
+                for name in level:
+                    if name not in renamed:
+                        olds.setdefault(key(name), []).append(name)
+                for k, names in olds.items():
+                    news = [n for n in candidates.get(k, ()) if n not in taken]
+                    if len(names) == 1 and len(news) == 1:
+                        renamed[names[0]] = news[0]
+                        taken.add(news[0])
+        return renamed
+
+
+def snapshot(root=None, attrs=()):
+    """
+    capture nodes, hierarchy, types and attrs into Snapshot
+    >>> snap = yurlungur.snapshot(attrs=["tx", "ty", "tz"])
+    """
+    return Snapshot.capture(root, attrs)
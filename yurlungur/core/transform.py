@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+batched transforms with numpy.
+
+matrices follow yurlungur.core.datatype.Matrix:
+4x4 row major for row vectors, translation in the last row,
+world = local * parent world, euler orders XYZ ... ZYX in radians.
+"""
+from yurlungur.core import env
+from yurlungur.core.exception import YException
+
+__all__ = [
+    "XYZ", "YZX", "ZXY", "XZY", "YXZ", "ZYX",
+    "levels", "world_matrices", "compose", "decompose"
+]
+
+XYZ, YZX, ZXY, XZY, YXZ, ZYX = range(6)
+_AXES = ((0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (1, 0, 2), (2, 1, 0))
+
+
+def _numpy():
+    np = env.Numpy()
+    if not np:
+        raise YException("numpy is required")
+    return np
+
+
+def levels(parents):
+    """
+    depth of every node, 0 for roots
+
+    Args:
+        parents: parent index of each node, -1 for roots
+
+    Returns: int array
+    """
+    np = _numpy()
+    parents = np.asarray(parents, np.int64)
+    depth = np.zeros(len(parents), np.int64)
+    up = parents.copy()
+    while True:
+        alive = np.flatnonzero(up >= 0)
+        if not len(alive):
+            return depth
+        depth[alive] += 1
+        if depth[alive].max() > len(parents):
+            raise YException("hierarchy has cycle")
+        up[alive] = parents[up[alive]]
+
+
+def world_matrices(parents, matrices):
+    """
+    world matrices from local matrices, one batched product per hierarchy level
+    >>> world = yurlungur.transform.world_matrices([-1, 0, 1], locals)
+
+    Args:
+        parents: parent index of each node, -1 for roots
+        matrices: (nodes, 4, 4) or (nodes, 16) local matrices, nan rows are identity
+
+    Returns: (nodes, 4, 4) array
+    """
+    np = _numpy()
+    parents = np.asarray(parents, np.int64)
+    local = np.array(matrices, np.float64).reshape(-1, 4, 4)
+    local[np.isnan(local).any(axis=(1, 2))] = np.identity(4)
+
+    depth = levels(parents)
+    world = local.copy()
+    for level in range(1, int(depth.max()) + 1 if len(depth) else 0):
+        rows = np.flatnonzero(depth == level)
+        world[rows] = np.matmul(local[rows], world[parents[rows]])
+    return world
+
+
+def _rotation(axis, angles):
+    """column vector rotation matrices about one axis"""
+    np = _numpy()
+    cos, sin = np.cos(angles), np.sin(angles)
+    m = np.zeros((len(angles), 3, 3))
+    m[:, axis, axis] = 1.0
+    a, b = ((1, 2), (2, 0), (0, 1))[axis]
+    m[:, a, a] = cos
+    m[:, b, b] = cos
+    m[:, a, b] = -sin
+    m[:, b, a] = sin
+    return m
+
+
+def compose(translate, rotate, scale, order=XYZ):
+    """
+    matrices from translate, euler rotate in radians and scale
+
+    Returns: (nodes, 4, 4) array
+    """
+    np = _numpy()
+    translate = np.asarray(translate, np.float64).reshape(-1, 3)
+    rotate = np.asarray(rotate, np.float64).reshape(-1, 3)
+    scale = np.asarray(scale, np.float64).reshape(-1, 3)
+
+    i, j, k = _AXES[order]
+    column = np.matmul(_rotation(k, rotate[:, k]), np.matmul(_rotation(j, rotate[:, j]), _rotation(i, rotate[:, i])))
+    m = np.zeros((len(translate), 4, 4))
+    m[:, :3, :3] = scale[:, :, None] * column.transpose(0, 2, 1)
+    m[:, 3, :3] = translate
+    m[:, 3, 3] = 1.0
+    return m
+
+
+def decompose(matrices, order=XYZ, degrees=False):
+    """
+    translate, euler rotate and scale of every matrix.
+    shear is ignored and negative determinant goes to scale x.
+
+    Args:
+        matrices: (nodes, 4, 4) or (nodes, 16)
+        order: euler order
+        degrees: rotate in degrees like Matrix.asDegrees
+
+    Returns: (translate, rotate, scale) of (nodes, 3) arrays
+    """
+    np = _numpy()
+    m = np.asarray(matrices, np.float64).reshape(-1, 4, 4)
+    translate = m[:, 3, :3].copy()
+
+    axes = m[:, :3, :3]
+    scale = np.linalg.norm(axes, axis=2)
+    scale[np.linalg.det(axes) < 0, 0] *= -1
+    r = (axes / np.where(scale == 0, 1.0, scale)[:, :, None]).transpose(0, 2, 1)
+
+    i, j, k = _AXES[order]
+    sign = 1.0 if order < 3 else -1.0
+    b = np.arcsin(np.clip(-sign * r[:, k, i], -1.0, 1.0))
+    a = np.arctan2(sign * r[:, k, j], r[:, k, k])
+    c = np.arctan2(sign * r[:, j, i], r[:, i, i])
+
+    # gimbal lock, the first and last axes turn together
+    locked = np.abs(np.cos(b)) < 1e-9
+    a[locked] = np.arctan2(-sign * r[locked, j, k], r[locked, j, j])
+    c[locked] = 0.0
+
+    rotate = np.zeros_like(translate)
+    rotate[:, i], rotate[:, j], rotate[:, k] = a, b, c
+    if degrees:
+        rotate = np.degrees(rotate)
+    return translate, rotate, scale
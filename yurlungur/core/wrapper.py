@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 import yurlungur
-from yurlungur.core.app import application
-from yurlungur.core import env
+from yurlungur.core import app, env
+
+_MISSING = object()
 
 
 class MultiObject(object):
     """
     command wrapper for any application
     """
+    _members = None
     if env.Photoshop():
         from yurlungur.adapters import photoshop as ps
         doc = ps.Document()._doc
@@ -30,7 +32,7 @@ class MultiObject(object):
         manager = sd.manager
 
     if env.C4D():
-        doc = application.documents.GetActiveDocument()
+        doc = app.application.documents.GetActiveDocument()
 
     if env.Davinci():
         resolve = env.__import__("DaVinciResolveScript").scriptapp("Resolve")
@@ -40,22 +42,62 @@ class MultiObject(object):
             from yurlungur.adapters import davinci
 
     def __getattr__(self, item):
-        try:
-            from inspect import getmembers
+        members = self.members
+        if members is None:
+            self._export(item, getattr(app.application, item))
+            return getattr(app.application, item)
+
+        if item not in members:
+            # plugins add commands to the module after the index is built
+            value = getattr(app.application, item, _MISSING)
+            if value is not _MISSING:
+                members[item] = value
+
+        if item in members:
+            # cache on instance, next lookup does not reach __getattr__
+            self._export(item, members[item])
+            self.__dict__[item] = members[item]
+            return members[item]
 
-        except ImportError:
-            setattr(yurlungur, item, getattr(application, item))
-            return getattr(application, item)
+        return getattr(yurlungur, item, False)
 
-        for cmd, _ in getmembers(application):
-            if cmd == item:
-                setattr(
-                    yurlungur, cmd,
-                    (lambda str: dict(getmembers(application))[str])(cmd)
-                )
-                return getattr(yurlungur, item)
+    def _export(self, item, value):
+        """set member on yurlungur package and keep what it replaced"""
+        exported = self.__dict__.setdefault("_exported", {})
+        if item not in exported:
+            exported[item] = getattr(yurlungur, item, _MISSING)
+        setattr(yurlungur, item, value)
 
-        return getattr(yurlungur, item, False)
+    @property
+    def members(self):
+        """
+        member index of application module.
+        built once per module, and rebuilt after invalidate.
+
+        Returns: dict or None
+        """
+        if self._members is None:
+            try:
+                from inspect import getmembers
+            except ImportError:
+                return None
+
+            self.__dict__["_members"] = dict(getmembers(app.application))
+        return self._members
+
+    def invalidate(self):
+        """
+        clear member index and cached members,
+        and restore names which are set on yurlungur package.
+        called when yurlungur.use switches application.
+        """
+        for item, value in self.__dict__.get("_exported", {}).items():
+            if value is _MISSING:
+                if item in vars(yurlungur):
+                    delattr(yurlungur, item)
+            else:
+                setattr(yurlungur, item, value)
+        self.__dict__.clear()
 
     def eval(self, script):
         """
@@ -73,10 +115,10 @@ class MultiObject(object):
             return mel.eval(script)
 
         if env.Houdini():
-            return application.hscript(script)
+            return self.module.hscript(script)
 
         if env.Nuke():
-            return application.tcl(script)
+            return self.module.tcl(script)
 
         if env.Davinci() and self.resolve:
             """
@@ -96,14 +138,14 @@ class MultiObject(object):
             return unity.EvalScript(script)
 
         if env.Max():
-            return application.runtime.execute(script)
+            return self.module.runtime.execute(script)
 
         if env.Photoshop():
-            return application.DoJavascript(script)
+            return self.module.DoJavascript(script)
 
     @property
     def module(self):
-        return application
+        return app.application
 
 
 class MetaObject(type):
@@ -126,5 +168,5 @@ class MetaObject(type):
 
 # Dynamic Class
 YObject = MetaObject("YObject", (object,),
-                     {"__doc__": MetaObject.__doc__,
+                     {"__doc__": MetaObject.__doc__, "__slots__": (),
                       "add": MetaObject.add, "rmv": MetaObject.rmv})